@@ -4,38 +4,50 @@ Think:it Pro — FastAPI 백엔드 메인 서버 (경량화 버전)
 전략:
 1. Lifespan 이벤트로 사전계산 데이터(TF-IDF, 통계치)를 서버 시작 시 1회 로드
 2. Whisper/GPT-4o/DALL-E 3은 OpenAI API로 위임 (GPU 불필요)
-3. BackgroundTasks로 비동기 처리 (즉시 job_id 반환 → 백그라운드 분석)
+3. JobScheduler로 비동기 처리 (즉시 job_id 반환 → 동시 실행 상한 + FIFO 대기열, 블로킹 미디어 작업은 executor)
 4. Coverage/Novelty 지표로 편향성 보정
 5. CLIP/PyTorch 제거 — Oracle Free Tier 1GB RAM 환경 최적화
 """
 
 import os
+import io
+import re
+import base64
 import json
+import math
+import hmac
+import hashlib
 import uuid
 import time
 import asyncio
 import logging
+import functools
+import struct
+import shutil
+import sqlite3
 import smtplib
+import threading
 import subprocess
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 import numpy as np
-import pandas as pd
-import pickle
 import cv2
-import requests as http_requests
-from sklearn.metrics.pairwise import cosine_similarity
+import httpx
+from PIL import Image
 
-from fastapi import FastAPI, UploadFile, File, Form, BackgroundTasks
+from fastapi import FastAPI, Request, Form, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from openai import OpenAI
+from python_multipart.multipart import MultipartParser, parse_options_header
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
 
 # ============================================================
@@ -55,17 +67,306 @@ DATA_DIR       = PROJECT_ROOT / "data"
 PRECOMPUTED_DIR = DATA_DIR / "precomputed"
 UPLOADS_DIR    = DATA_DIR / "uploads"
 OUTPUTS_DIR    = DATA_DIR / "outputs"
+CACHE_DIR      = DATA_DIR / "cache"
 
-for d in [DATA_DIR, PRECOMPUTED_DIR, UPLOADS_DIR, OUTPUTS_DIR]:
+for d in [DATA_DIR, PRECOMPUTED_DIR, UPLOADS_DIR, OUTPUTS_DIR, CACHE_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 WHISPER_MAX_MB = 25  # Whisper API 파일 크기 제한
 
+# 긴 오디오 분할 전사 — 무음 구간 기준으로 약 WHISPER_CHUNK_SEC초씩 나눠 병렬 전송
+WHISPER_CHUNK_SEC   = int(os.getenv("WHISPER_CHUNK_SEC", "600"))
+WHISPER_CONCURRENCY = int(os.getenv("WHISPER_CONCURRENCY", "4"))
+SILENCE_NOISE_DB    = -35   # silencedetect 무음 판정 임계값
+SILENCE_MIN_SEC     = 0.5   # 분할 지점으로 쓸 최소 무음 길이
+
+# OpenAI/이미지 다운로드 HTTP 연결 풀 상한 (동시 작업 × Phase 4 병렬 호출 수 기준)
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_TIMEOUT_SEC     = float(os.getenv("OPENAI_TIMEOUT_SEC", "120"))
+
+# 작업 스케줄러 — 동시 분석 수 / 대기열 길이 / 블로킹 미디어 작업(ffmpeg) 스레드 수
+MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "2"))
+MAX_QUEUED_JOBS     = int(os.getenv("MAX_QUEUED_JOBS", "20"))
+MEDIA_WORKERS       = int(os.getenv("MEDIA_WORKERS", "2"))
+IO_WORKERS          = int(os.getenv("IO_WORKERS", "4"))  # 캐시·정리 등 짧은 파일 I/O (ffmpeg 대기열과 분리)
+
+# 업로드 — multipart 본문을 받는 즉시 UPLOADS_DIR에 기록 (영상 크기와 무관하게 메모리 일정)
+MAX_UPLOAD_MB        = int(os.getenv("MAX_UPLOAD_MB", "500"))
+FORM_FIELD_MAX_BYTES = 64 * 1024  # category / custom_prompt 등 텍스트 필드 상한 (Content-Length 사전 검사 여유분 겸용)
+UPLOAD_BLOCK_BYTES   = 1024 * 1024  # 업로드 영상을 이만큼 모아서 IO_EXECUTOR에서 기록 + 해시
+
+# 작업 저장소 — sqlite(기본, WAL) / redis(Redis 호환 서버, redis 패키지 필요)
+JOB_STORE   = os.getenv("JOB_STORE", "sqlite")
+JOB_DB_PATH = Path(os.getenv("JOB_DB_PATH", str(DATA_DIR / "jobs.db")))
+REDIS_URL   = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# SSE 진행 스트림 — 이벤트가 없을 때 저장소 재확인(다른 워커 작업) + keep-alive 주기
+SSE_POLL_SEC = float(os.getenv("SSE_POLL_SEC", "5"))
+
+# 단일 호출 모드 — 점수·제목·썸네일 키워드·리포트를 GPT-4o 구조화 출력 1회로 생성 (실패 시 분할 호출)
+SINGLE_SHOT_MODE = os.getenv("SINGLE_SHOT_MODE", "0") == "1"
+
+# 리포트 스트리밍 생성 — 누적 텍스트를 부분 결과(report_draft)로 반영하는 최소 간격
+REPORT_STREAMING           = os.getenv("REPORT_STREAMING", "1") == "1"
+REPORT_STREAM_INTERVAL_SEC = float(os.getenv("REPORT_STREAM_INTERVAL_SEC", "0.5"))
+
+# 작업 보존 시간 / 작업 범위 파일(썸네일·잔여 업로드) 정리 주기
+JOB_TTL_SEC          = int(os.getenv("JOB_TTL_SEC", "3600"))
+JOB_STALE_SEC        = int(os.getenv("JOB_STALE_SEC", "21600"))  # 진행 중 상태로 남은 작업(워커 중단) 회수
+JANITOR_INTERVAL_SEC = int(os.getenv("JANITOR_INTERVAL_SEC", "300"))
+JANITOR_GRACE_SEC    = 600  # 생성 직후 파일 보호 구간
+
+# 결과 캐시 — 업로드 SHA-256 기준 (대본: 영상만, 분석 결과: 영상 + 카테고리 + 추가 요청)
+CACHE_ENABLED      = os.getenv("CACHE_ENABLED", "1") == "1"
+CACHE_MAX_MB       = int(os.getenv("CACHE_MAX_MB", "500"))
+CACHE_MAX_AGE_DAYS = float(os.getenv("CACHE_MAX_AGE_DAYS", "7"))
+
+# 사전계산 카테고리 인덱스 (app/precompute.py write_category_index와 동일 포맷)
+INDEX_PATH    = PRECOMPUTED_DIR / "category_index.bin"
+INDEX_MAGIC   = b"THINKIDX"
+INDEX_VERSION = 2
+INDEX_ALIGN   = 64
+
+# category_stats.json의 전체 데이터 기준 태그 통계 키 (app/precompute.py ALL_CATEGORIES_KEY)
+ALL_CATEGORIES_KEY = "_all"
+
+# 사전계산 무중단 재로드 — 관리자 API 토큰 (미설정 시 API 비활성) / 파일 감시 주기 (0이면 감시 안 함)
+ADMIN_TOKEN           = os.getenv("ADMIN_TOKEN", "")
+PRECOMPUTED_WATCH_SEC = float(os.getenv("PRECOMPUTED_WATCH_SEC", "0"))
+PRECOMPUTED_FILES     = [
+    INDEX_PATH,
+    PRECOMPUTED_DIR / "category_stats.json",
+    PRECOMPUTED_DIR / "top_titles.json",
+    PRECOMPUTED_DIR / "manifest.json",
+]
+
 # ============================================================
 # 전역 저장소
 # ============================================================
-PRECOMPUTED = {}  # TF-IDF 벡터, 통계치, 제목 패턴
-JOBS = {}         # 분석 작업 상태 (job_id → 결과)
+PRECOMPUTED = {}  # 현재 사전계산 스냅샷 (TF-IDF 인덱스, 통계치, 제목 패턴) — 재로드 시 dict 참조째 교체
+
+
+def job_expires_at(job: dict) -> float:
+    """완료/실패 작업은 지금부터 JOB_TTL_SEC, 진행 중 작업은 생성 후 JOB_STALE_SEC (중단된 작업 회수)"""
+    if job["status"] in ("completed", "failed"):
+        return time.time() + JOB_TTL_SEC
+    return datetime.fromisoformat(job["created_at"]).timestamp() + JOB_STALE_SEC
+
+
+class SQLiteJobStore:
+    """
+    분석 작업 상태 저장소 (기본) — SQLite 파일 1개, WAL 모드
+    - 재시작/배포 후에도 결과 유지, 같은 호스트의 uvicorn 워커 여러 개가 공유
+    - 작업 본문은 JSON 컬럼 하나, 만료 판단용 expires_at만 인덱스 컬럼으로 분리
+    - sweep은 expires_at 인덱스 범위 삭제 → 만료된 작업 수에만 비례
+    """
+
+    def __init__(self, path: Path):
+        self.path  = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, expires_at REAL NOT NULL, data TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_expires_at ON jobs (expires_at)")
+
+    def create(self, job_id: str, job: dict):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?)",
+                (job_id, job["status"], job_expires_at(job), json.dumps(job, ensure_ascii=False)),
+            )
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM jobs WHERE job_id = ? AND expires_at > ?", (job_id, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, job_id: str, **fields) -> dict | None:
+        """필드 병합 + version 증가 (읽기-수정-쓰기를 한 트랜잭션으로 — 다른 워커와 경합 방지)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+                if row is None:
+                    self._conn.execute("ROLLBACK")
+                    return None
+                old = json.loads(row[0])
+                job = {**old, **fields, "version": old.get("version", 0) + 1}
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, expires_at = ?, data = ? WHERE job_id = ?",
+                    (job["status"], job_expires_at(job), json.dumps(job, ensure_ascii=False), job_id),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return job
+
+    def delete(self, job_id: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+
+    def items(self) -> list:
+        """만료되지 않은 (job_id, job) 목록"""
+        with self._lock:
+            rows = self._conn.execute("SELECT job_id, data FROM jobs WHERE expires_at > ?", (time.time(),)).fetchall()
+        return [(job_id, json.loads(data)) for job_id, data in rows]
+
+    def sweep(self) -> int:
+        """만료 작업 삭제, 삭제 개수 반환"""
+        with self._lock:
+            return self._conn.execute("DELETE FROM jobs WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RedisJobStore:
+    """
+    Redis 호환 서버(Redis/Valkey/KeyDB 등) 작업 저장소 — JOB_STORE=redis
+    - 작업 본문: {prefix}{job_id} 키에 JSON 문자열
+    - 만료 인덱스: {prefix}expires ZSET (score = expires_at) → 범위 조회로 만료분만 삭제
+    - 여러 호스트의 워커가 같은 서버를 공유할 수 있음
+    """
+
+    def __init__(self, url: str, prefix: str = "thinkit:job:"):
+        try:
+            import redis  # 선택 의존성 — JOB_STORE=redis일 때만 필요
+        except ImportError as e:
+            raise RuntimeError("JOB_STORE=redis 사용 시 redis 패키지가 필요합니다: pip install redis") from e
+        self._redis  = redis.Redis.from_url(url, decode_responses=True)
+        self._prefix = prefix
+        self._index  = prefix + "expires"
+
+    def _key(self, job_id: str) -> str:
+        return self._prefix + job_id
+
+    def create(self, job_id: str, job: dict):
+        pipe = self._redis.pipeline()
+        pipe.set(self._key(job_id), json.dumps(job, ensure_ascii=False))
+        pipe.zadd(self._index, {job_id: job_expires_at(job)})
+        pipe.execute()
+
+    def get(self, job_id: str) -> dict | None:
+        expires_at = self._redis.zscore(self._index, job_id)
+        if expires_at is None or expires_at <= time.time():
+            return None
+        data = self._redis.get(self._key(job_id))
+        return json.loads(data) if data else None
+
+    def update(self, job_id: str, **fields) -> dict | None:
+        """필드 병합 + version 증가 (WATCH 기반 낙관적 트랜잭션)"""
+        merged = {}
+
+        def _apply(pipe):
+            data = pipe.get(self._key(job_id))
+            if data is None:
+                return
+            old           = json.loads(data)
+            merged["job"] = {**old, **fields, "version": old.get("version", 0) + 1}
+            pipe.multi()
+            pipe.set(self._key(job_id), json.dumps(merged["job"], ensure_ascii=False))
+            pipe.zadd(self._index, {job_id: job_expires_at(merged["job"])})
+
+        self._redis.transaction(_apply, self._key(job_id))
+        return merged.get("job")
+
+    def delete(self, job_id: str):
+        pipe = self._redis.pipeline()
+        pipe.delete(self._key(job_id))
+        pipe.zrem(self._index, job_id)
+        pipe.execute()
+
+    def count(self) -> int:
+        return self._redis.zcount(self._index, f"({time.time()}", "+inf")
+
+    def items(self) -> list:
+        job_ids = self._redis.zrangebyscore(self._index, f"({time.time()}", "+inf")
+        if not job_ids:
+            return []
+        values = self._redis.mget([self._key(j) for j in job_ids])
+        return [(j, json.loads(v)) for j, v in zip(job_ids, values) if v]
+
+    def sweep(self) -> int:
+        expired = self._redis.zrangebyscore(self._index, "-inf", time.time())
+        if not expired:
+            return 0
+        pipe = self._redis.pipeline()
+        pipe.delete(*[self._key(j) for j in expired])
+        pipe.zrem(self._index, *expired)
+        pipe.execute()
+        return len(expired)
+
+    def close(self):
+        self._redis.close()
+
+
+def create_job_store():
+    """JOB_STORE 환경변수로 저장소 선택 (sqlite 기본 / redis)"""
+    if JOB_STORE == "redis":
+        return RedisJobStore(REDIS_URL)
+    return SQLiteJobStore(JOB_DB_PATH)
+
+
+job_store = create_job_store()  # 분석 작업 상태 (job_id → 상태/결과)
+
+# 작업 저장소 호출 전용 스레드 1개 — 이벤트 루프가 SQLite 잠금/Redis 왕복을 기다리지 않음
+# 단일 스레드라 같은 작업의 갱신이 호출 순서대로 기록됨 (부분 결과가 이전 상태로 덮이지 않음)
+STORE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="store")
+
+
+async def run_store(func, *args, **kwargs):
+    """job_store 메서드를 STORE_EXECUTOR에서 실행하고 결과를 await"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(STORE_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+class ProgressBus:
+    """
+    작업 진행 이벤트 구독 (프로세스 내) — SSE 연결마다 asyncio.Queue 1개
+    - 다른 워커 프로세스의 변경은 전달되지 않으므로 SSE 쪽에서 저장소 version 폴링으로 보완
+    """
+
+    def __init__(self):
+        self._subscribers = {}  # job_id → set[asyncio.Queue]
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        subs = self._subscribers.get(job_id)
+        if subs is not None:
+            subs.discard(queue)
+            if not subs:
+                del self._subscribers[job_id]
+
+    def publish(self, job_id: str, job: dict):
+        for queue in self._subscribers.get(job_id, ()):
+            queue.put_nowait(job)
+
+
+progress_bus = ProgressBus()
+
+
+async def update_job(job_id: str, **fields) -> dict | None:
+    """작업 저장소 갱신 + 같은 프로세스의 SSE 구독자에게 즉시 전달"""
+    job = await run_store(job_store.update, job_id, **fields)
+    if job is not None:
+        progress_bus.publish(job_id, job)
+    return job
 
 # ============================================================
 # 카테고리 매핑
@@ -98,48 +399,252 @@ async def lifespan(app: FastAPI):
     logger.info("서버 시작 — 사전계산 데이터 로딩 중...")
     logger.info("=" * 60)
 
-    start = time.time()
-
-    # TF-IDF 벡터 로드
-    PRECOMPUTED["tfidf"] = {}
-    PRECOMPUTED["vectorizer"] = {}
-    for f in PRECOMPUTED_DIR.glob("tfidf_*.npy"):
-        category = f.stem.replace("tfidf_", "")
-        PRECOMPUTED["tfidf"][category] = np.load(f)
-        pkl_path = PRECOMPUTED_DIR / f"vectorizer_{category}.pkl"
-        if pkl_path.exists():
-            with open(pkl_path, "rb") as pf:
-                PRECOMPUTED["vectorizer"][category] = pickle.load(pf)
-    logger.info(f"  TF-IDF 벡터: {len(PRECOMPUTED['tfidf'])}개 카테고리")
-
-    # 카테고리 통계
+    snapshot = await reload_precomputed()
+    logger.info(f"로딩 완료 ({snapshot['load_sec']:.1f}초)")
+    logger.info("=" * 60)
+
+    await run_io(result_cache.prune)
+    scheduler.start()
+    janitor = asyncio.create_task(janitor_loop())
+    watcher = asyncio.create_task(precomputed_watch_loop(snapshot["signature"])) if PRECOMPUTED_WATCH_SEC > 0 else None
+
+    yield  # 서버 실행
+
+    logger.info("서버 종료 — 리소스 해제")
+    janitor.cancel()
+    if watcher is not None:
+        watcher.cancel()
+    # 이 프로세스가 끝내지 못한 작업은 실패로 기록 — 클라이언트가 JOB_STALE_SEC 동안 멈춘 작업을 폴링하지 않도록
+    for job_id in await scheduler.stop():
+        await update_job(job_id, status="failed", error="서버 재시작으로 분석이 중단되었습니다. 영상을 다시 업로드해주세요.")
+    MEDIA_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    IO_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    STORE_EXECUTOR.shutdown(wait=True)
+    PRECOMPUTED.clear()
+    await client.close()
+    await http_client.aclose()
+    job_store.close()
+
+
+def precomputed_signature() -> tuple:
+    """사전계산 파일별 (이름, 크기, mtime_ns) — precompute는 파일을 rename으로 교체하므로 갱신 시 항상 바뀜"""
+    signature = []
+    for path in PRECOMPUTED_FILES:
+        try:
+            st = path.stat()
+            signature.append((path.name, st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            signature.append((path.name, None, None))
+    return tuple(signature)
+
+
+def precomputed_generation() -> str:
+    """
+    사전계산 데이터 세대 ID — 내용이 같으면 precompute를 다시 돌려도 같은 값
+    - manifest.json이 있으면 카테고리별 콘텐츠 해시(text/count)로 계산 (산출물 전체가 이 해시로 결정됨)
+    - 없으면(샘플 데이터 등) 산출물 파일 내용 자체의 해시
+    """
+    digest        = hashlib.sha256()
+    manifest_path = PRECOMPUTED_DIR / "manifest.json"
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            categories = json.load(f).get("categories", {})
+        digest.update(json.dumps(categories, sort_keys=True).encode("utf-8"))
+    else:
+        for path in PRECOMPUTED_FILES:
+            if path.exists():
+                digest.update(path.name.encode("utf-8") + b"\0" + path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def load_precomputed() -> dict:
+    """
+    사전계산 파일 → 새 스냅샷 dict (동기, 스레드에서 실행)
+    - 카테고리 인덱스는 파일 1개를 mmap, 질의 인코더는 로드 시 미리 구성 → 교체 직후 첫 요청도 지연 없음
+    - 원본 DataFrame은 로드하지 않음 (태그 Coverage 통계는 category_stats.json에 포함)
+    - generation: 내용 기반 세대 ID (결과 캐시 키에 포함 → 새 트렌드 데이터가 옛 분석 결과에 가려지지 않음)
+    """
+    start    = time.time()
+    snapshot = {
+        "signature":  precomputed_signature(),
+        "generation": precomputed_generation(),
+        "loaded_at":  datetime.now().isoformat(),
+    }
+
+    if INDEX_PATH.exists():
+        index = CategoryIndex(INDEX_PATH)
+        for category in index.categories():
+            index.encoder(category)
+        snapshot["index"] = index
+        logger.info(f"  카테고리 인덱스: {len(index)}개 카테고리 (v{INDEX_VERSION})")
+    else:
+        logger.warning(f"  카테고리 인덱스 없음: {INDEX_PATH} — python -m app.precompute 실행 필요")
+
     stats_path = PRECOMPUTED_DIR / "category_stats.json"
     if stats_path.exists():
         with open(stats_path, "r", encoding="utf-8") as f:
-            PRECOMPUTED["stats"] = json.load(f)
-        logger.info(f"  카테고리 통계: {len(PRECOMPUTED['stats'])}개 카테고리")
+            stats = json.load(f)
+        snapshot["tag_stats_all"] = stats.pop(ALL_CATEGORIES_KEY, {})
+        snapshot["stats"]         = stats
+        logger.info(f"  카테고리 통계: {len(stats)}개 카테고리")
 
-    # 인기 제목 패턴
     titles_path = PRECOMPUTED_DIR / "top_titles.json"
     if titles_path.exists():
         with open(titles_path, "r", encoding="utf-8") as f:
-            PRECOMPUTED["top_titles"] = json.load(f)
-        logger.info(f"  제목 패턴: {len(PRECOMPUTED['top_titles'])}개 카테고리")
+            snapshot["top_titles"] = json.load(f)
+        # TF-IDF fallback의 topic_score용 제목 단어 집합 (요청마다 join/split 하지 않도록)
+        snapshot["top_title_words"] = {
+            category: frozenset(" ".join(titles).split())
+            for category, titles in snapshot["top_titles"].items()
+        }
+        logger.info(f"  제목 패턴: {len(snapshot['top_titles'])}개 카테고리")
 
-    # YouTube 메타데이터
-    csv_path = DATA_DIR / "youtube_top200_data.csv"
-    if csv_path.exists():
-        PRECOMPUTED["df"] = pd.read_csv(csv_path)
-        logger.info(f"  YouTube 데이터: {len(PRECOMPUTED['df'])}개 영상")
+    snapshot["load_sec"] = time.time() - start
+    return snapshot
 
-    elapsed = time.time() - start
-    logger.info(f"로딩 완료 ({elapsed:.1f}초)")
-    logger.info("=" * 60)
 
-    yield  # 서버 실행
+_reload_lock = asyncio.Lock()
 
-    logger.info("서버 종료 — 리소스 해제")
-    PRECOMPUTED.clear()
+
+async def reload_precomputed() -> dict:
+    """
+    새 사전계산 세대를 백그라운드 스레드에서 로드한 뒤 PRECOMPUTED 참조만 교체
+    - 로드 실패 시 예외 전파, 기존 스냅샷 유지
+    - 진행 중 작업은 시작 시 잡아 둔 스냅샷(ctx["precomputed"])을 끝까지 사용
+    """
+    global PRECOMPUTED
+    async with _reload_lock:
+        snapshot    = await run_io(load_precomputed)
+        PRECOMPUTED = snapshot
+    logger.info(f"사전계산 스냅샷 적용: 세대 {snapshot['generation']}")
+    return snapshot
+
+
+async def precomputed_watch_loop(signature: tuple):
+    """
+    PRECOMPUTED_WATCH_SEC마다 사전계산 파일 서명 확인 → 바뀐 뒤 한 주기 동안 그대로면 재로드
+    - precompute가 파일을 차례로 교체하는 도중의 세대 혼합 방지
+    """
+    pending = None
+    while True:
+        await asyncio.sleep(PRECOMPUTED_WATCH_SEC)
+        current = precomputed_signature()
+        if current == signature:
+            pending = None
+            continue
+        if current != pending:
+            pending = current
+            continue
+        try:
+            signature = (await reload_precomputed())["signature"]
+        except Exception as e:
+            signature = current  # 같은 파일로 재시도하지 않음 — 다음 갱신을 기다림
+            logger.error(f"사전계산 재로드 실패, 기존 스냅샷 유지: {e}")
+        pending = None
+
+
+class CategoryIndex:
+    """
+    precompute가 생성한 단일 카테고리 인덱스 파일 리더
+    - 파일 전체를 np.memmap 1회로 열고 header JSON만 파싱 (나머지는 지연 참조)
+    - 배열은 memmap 뷰이므로 fork된 워커 간 페이지 캐시 공유, 상주 메모리는 실제 접근분만
+    - 어휘 dict / 질의 인코더는 카테고리별 첫 접근 시 구성 후 캐시
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._mm  = np.memmap(path, dtype=np.uint8, mode="r")
+
+        prefix_len = len(INDEX_MAGIC) + struct.calcsize("<IIQ")
+        if bytes(self._mm[:len(INDEX_MAGIC)]) != INDEX_MAGIC:
+            raise ValueError(f"카테고리 인덱스 형식이 아닙니다: {path}")
+        version, _, header_len = struct.unpack("<IIQ", bytes(self._mm[len(INDEX_MAGIC):prefix_len]))
+        if version != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 인덱스 버전 v{version} (서버: v{INDEX_VERSION}) — precompute 재실행 필요")
+
+        self.header      = json.loads(bytes(self._mm[prefix_len:prefix_len + header_len]).decode("utf-8"))
+        self._data_start = (prefix_len + header_len + INDEX_ALIGN - 1) // INDEX_ALIGN * INDEX_ALIGN
+        self._categories = self.header["categories"]
+        self._cache      = {}
+
+    def __contains__(self, category: str) -> bool:
+        return category in self._categories
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def categories(self) -> list[str]:
+        return list(self._categories)
+
+    def _array(self, category: str, name: str) -> np.ndarray:
+        spec  = self._categories[category]["arrays"][name]
+        dtype = np.dtype(spec["dtype"])
+        start = self._data_start + spec["offset"]
+        return self._mm[start:start + spec["length"] * dtype.itemsize].view(dtype)
+
+    def _cached(self, key: tuple, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def terms(self, category: str) -> list[str]:
+        return self._cached(
+            ("terms", category),
+            lambda: bytes(self._array(category, "terms")).decode("utf-8").split("\n"),
+        )
+
+    def idf(self, category: str) -> np.ndarray:
+        return self._array(category, "idf")
+
+    def centroid(self, category: str) -> np.ndarray:
+        """카테고리 TF-IDF 행들의 평균 벡터 (precompute 시 계산)"""
+        return self._array(category, "centroid")
+
+    def encoder(self, category: str) -> "QueryEncoder":
+        return self._cached(
+            ("encoder", category),
+            lambda: QueryEncoder(self.terms(category), self.idf(category), self.header.get("params", {})),
+        )
+
+    def mean_similarity(self, category: str, query_vector: np.ndarray) -> float:
+        """
+        질의 벡터와 카테고리 전체 행의 평균 코사인 유사도
+        - 질의 벡터와 저장된 행이 모두 L2 정규화 → mean_i(q·r_i) = q·mean_i(r_i) = q·centroid
+        - 행 수와 무관하게 O(vocab)
+        """
+        return float(query_vector @ self.centroid(category))
+
+
+class QueryEncoder:
+    """
+    저장된 어휘·IDF만으로 동작하는 질의 TF-IDF 인코더 (sklearn TfidfVectorizer.transform과 동일 결과)
+    - 소문자화 → token_pattern 토큰화 → n-gram 생성 → 어휘 lookup
+    - 카운트·IDF 가중·L2 정규화는 NumPy 벡터 연산
+    """
+
+    def __init__(self, terms: list[str], idf: np.ndarray, params: dict):
+        self.vocabulary = {t: i for i, t in enumerate(terms)}
+        self.idf        = np.asarray(idf, dtype=np.float64)
+        self.lowercase  = params.get("lowercase", True)
+        self.token_re   = re.compile(params.get("token_pattern", r"(?u)\b\w\w+\b"))
+        self.min_n, self.max_n = params.get("ngram_range", (1, 2))
+
+    def ngrams(self, text: str) -> list[str]:
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_re.findall(text)
+        grams  = list(tokens) if self.min_n == 1 else []
+        for n in range(max(self.min_n, 2), min(self.max_n, len(tokens)) + 1):
+            grams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        return grams
+
+    def encode(self, grams: list[str]) -> np.ndarray:
+        """n-gram 목록 → L2 정규화된 dense 질의 벡터 (길이 = 어휘 크기)"""
+        vocab = self.vocabulary
+        ids   = np.fromiter((vocab[g] for g in grams if g in vocab), dtype=np.intp)
+        vec   = np.bincount(ids, minlength=len(self.idf)).astype(np.float64) * self.idf
+        norm  = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
 
 
 # ============================================================
@@ -161,148 +666,503 @@ app.add_middleware(
 # /outputs 마운트는 반드시 / 마운트보다 먼저 등록
 app.mount("/outputs", StaticFiles(directory=str(OUTPUTS_DIR)), name="outputs")
 
-# OpenAI 클라이언트
-client = OpenAI(api_key=OPENAI_API_KEY)
+# OpenAI 비동기 클라이언트 — 모든 호출이 이벤트 루프를 막지 않고 연결 풀을 공유
+client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    timeout=OPENAI_TIMEOUT_SEC,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_CONNECTIONS // 2,
+        ),
+    ),
+)
+
+# DALL-E 결과 이미지 다운로드용 비동기 HTTP 클라이언트
+http_client = httpx.AsyncClient(
+    timeout=30,
+    limits=httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS),
+)
 
 
 # ============================================================
 # 3. 파이프라인 모듈
 # ============================================================
 
-# --- 3-1. 프레임 추출 (최대 3장, 640px 리사이즈) ---
-def extract_key_frames(video_path: str, max_frames: int = 3) -> list[str]:
+# 블로킹 미디어 작업 전용 스레드 풀 — 이벤트 루프 스레드에서 ffmpeg/OpenCV를 돌리지 않음
+MEDIA_EXECUTOR = ThreadPoolExecutor(max_workers=MEDIA_WORKERS, thread_name_prefix="media")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """동기 함수를 MEDIA_EXECUTOR에서 실행하고 결과를 await"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(MEDIA_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+# 짧은 파일 I/O 전용 스레드 풀 — 캐시 조회가 ffmpeg 작업 뒤에 줄 서지 않도록 MEDIA_EXECUTOR와 분리
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
+
+
+async def run_io(func, *args, **kwargs):
+    """동기 파일 I/O 함수를 IO_EXECUTOR에서 실행하고 결과를 await"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(IO_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+
+# --- 3-1. 미디어 전처리 (ffprobe 헤더 조회 + ffmpeg 단일 디코딩 패스) ---
+# Whisper 전송용 오디오: 16kHz / mono / 32kbps CBR MP3 (~0.23MB/분 → 25MB ≈ 109분)
+WHISPER_AUDIO_ARGS = ["-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "32k"]
+
+# 키 프레임 — 영상 전체에서 후보를 고르게 뽑은 뒤 가장 서로 다른 프레임만 선택
+FRAME_CANDIDATES = 48
+FRAME_MIN_DETAIL = 8.0  # 9×8 그레이 밝기 표준편차 하한 (검은 화면/페이드 제외)
+
+
+def probe_media(video_path: str) -> dict:
+    """ffprobe로 컨테이너 헤더만 읽어 길이와 오디오/비디오 스트림 유무 확인"""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration:stream=codec_type", "-of", "json", video_path],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise ValueError(f"영상 파일을 읽을 수 없습니다: {result.stderr[-200:]}")
+
+    info  = json.loads(result.stdout or "{}")
+    types = {s.get("codec_type") for s in info.get("streams", [])}
+    return {
+        "duration":  float(info.get("format", {}).get("duration") or 0),
+        "has_audio": "audio" in types,
+        "has_video": "video" in types,
+    }
+
+
+def split_jpeg_stream(data: bytes) -> list:
+    """image2pipe(mjpeg) 출력을 SOI(FFD8)~EOI(FFD9) 마커 기준으로 JPEG 버퍼 목록으로 분리"""
+    frames, pos = [], 0
+    while True:
+        start = data.find(b"\xff\xd8", pos)
+        if start < 0:
+            break
+        end = data.find(b"\xff\xd9", start + 2)
+        if end < 0:
+            break
+        frames.append(data[start:end + 2])
+        pos = end + 2
+    return frames
+
+
+def frame_signature(frame: bytes) -> dict:
     """
-    OpenCV로 1fps 간격 프레임 추출 — 최대 3장, 640px 리사이즈로 메모리 절약
-    - fps를 읽어 매 1초마다 1장 추출 (1fps)
-    - max_frames(3)장까지만 저장
+    프레임 다양성 비교용 저비용 특징
+    - JPEG draft 모드로 1/8 축소 디코딩 → 전체 해상도 디코딩 없이 계산
+    - hist: HSV 색 분포 (H 16 × S 4 × V 4 = 256 bin, 합 1)
+    - dhash: 9×8 그레이 인접 픽셀 밝기 차 64bit 지각 해시
+    - detail: 밝기 표준편차 (검은 화면/페이드 프레임 판별)
     """
-    cap = cv2.VideoCapture(video_path)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    fps          = cap.get(cv2.CAP_PROP_FPS) or 30.0  # fps 읽기 실패 시 30 기본값
-    saved_paths  = []
+    with Image.open(io.BytesIO(frame)) as img:
+        img.draft("RGB", (80, 80))
+        hsv  = np.asarray(img.convert("RGB").resize((64, 64)).convert("HSV"), dtype=np.uint16)
+        gray = np.asarray(img.convert("L").resize((9, 8)), dtype=np.int16)
 
-    if total_frames <= 0 or fps <= 0:
-        cap.release()
-        return saved_paths
+    bins = (hsv[..., 0] >> 4) * 16 + (hsv[..., 1] >> 6) * 4 + (hsv[..., 2] >> 6)
+    hist = np.bincount(bins.ravel(), minlength=256) / bins.size
+    return {
+        "hist":   hist,
+        "dhash":  (gray[:, 1:] > gray[:, :-1]).ravel(),
+        "detail": float(gray.std()),
+    }
 
-    # 1fps 간격으로 추출할 프레임 인덱스 생성, max_frames 초과 시 앞쪽 max_frames개만 사용
-    step = int(fps)  # 1초당 프레임 수
-    frame_indices = list(range(0, total_frames, step))[:max_frames]
 
-    for i, idx in enumerate(frame_indices):
-        cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-        ret, frame = cap.read()
-        if not ret:
-            continue
+def select_diverse_frames(frames: list, k: int) -> list:
+    """
+    후보 프레임 중 서로 가장 다른 k장을 greedy max-min 방식으로 선택
+    - 거리 = 0.5 × 히스토그램 L1/2 + 0.5 × dHash 해밍 거리/64 (0~1)
+    - 밝기 변화가 거의 없는 프레임(검은 화면 등)은 다른 후보가 충분하면 제외
+    - 반환 순서는 원래 시간순
+    """
+    if len(frames) <= k:
+        return frames
+
+    sigs     = [frame_signature(f) for f in frames]
+    detailed = [i for i, sig in enumerate(sigs) if sig["detail"] >= FRAME_MIN_DETAIL]
+    pool     = detailed if len(detailed) >= k else list(range(len(frames)))
+
+    hists  = np.stack([sigs[i]["hist"] for i in pool])
+    hashes = np.stack([sigs[i]["dhash"] for i in pool])
+    dist   = (
+        0.5 * np.abs(hists[:, None, :] - hists[None, :, :]).sum(axis=2) / 2
+        + 0.5 * (hashes[:, None, :] != hashes[None, :, :]).mean(axis=2)
+    )
+
+    # 가장 디테일이 많은 프레임에서 시작 → 이미 고른 프레임들과의 최소 거리가 가장 큰 후보를 추가
+    chosen   = [int(np.argmax([sigs[i]["detail"] for i in pool]))]
+    min_dist = dist[chosen[0]].copy()
+    while len(chosen) < k:
+        nxt = int(np.argmax(min_dist))
+        chosen.append(nxt)
+        min_dist = np.minimum(min_dist, dist[nxt])
+
+    return [frames[pool[i]] for i in sorted(chosen)]
+
+
+def preprocess_media(video_path: str, max_frames: int = 3) -> dict:
+    """
+    영상을 한 번만 디코딩해 Whisper용 오디오와 키 프레임을 동시에 출력
+    - 출력 1: WHISPER_AUDIO_ARGS로 바로 인코딩 → 별도 압축 패스 불필요
+    - 출력 2: 키프레임만 디코딩(-skip_frame nokey)해 영상 전체 길이에 고르게 퍼진
+      후보 FRAME_CANDIDATES장 추출 → 가장 서로 다른 max_frames장만 남김
+    - 프레임은 stdout(image2pipe)으로 받아 메모리 JPEG 버퍼로만 유지 (디스크 기록 없음)
+    - 스트림이 없는 출력은 생략 (무음 영상 / 오디오 전용 파일)
+    - 오디오 출력은 항상 `<원본 이름>.whisper.mp3` — 업로드가 .mp3여도 입력 파일과 겹치지 않음
+    """
+    probe      = probe_media(video_path)
+    audio_path = str(Path(video_path).with_name(Path(video_path).stem + ".whisper.mp3"))
+    interval   = probe["duration"] / FRAME_CANDIDATES
+
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
+    if probe["has_video"]:
+        cmd += ["-skip_frame:v", "nokey"]  # 비디오 디코더만 적용 — 오디오는 그대로 전부 디코딩
+    cmd += ["-i", video_path]
+    if probe["has_audio"]:
+        cmd += ["-map", "0:a:0", "-vn", *WHISPER_AUDIO_ARGS, "-y", audio_path]
+    if probe["has_video"]:
+        cmd += [
+            "-map", "0:v:0", "-an",
+            "-vf", f"select='isnan(prev_selected_t)+gte(t-prev_selected_t,{interval:.3f})',scale='min(640,iw)':-2",
+            "-fps_mode", "vfr",
+            "-frames:v", str(FRAME_CANDIDATES),
+            "-f", "image2pipe", "-c:v", "mjpeg", "-q:v", "4",
+            "pipe:1",
+        ]
+
+    candidates = []
+    if probe["has_audio"] or probe["has_video"]:
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0:
+            # 중간에 끊긴 오디오/프레임으로 분석을 이어가지 않도록 이 함수가 만든 출력만 지우고 실패 처리
+            if probe["has_audio"]:
+                Path(audio_path).unlink(missing_ok=True)
+            raise RuntimeError(f"미디어 전처리 실패: {result.stderr[-300:].decode(errors='replace')}")
+        candidates = split_jpeg_stream(result.stdout)
+
+    frames = select_diverse_frames(candidates, max_frames)
+
+    if not (probe["has_audio"] and os.path.exists(audio_path)):
+        audio_path = ""
 
-        # 640px 리사이즈 (메모리 절약)
-        h, w = frame.shape[:2]
-        if w > 640:
-            scale = 640 / w
-            frame = cv2.resize(frame, (640, int(h * scale)), interpolation=cv2.INTER_AREA)
+    logger.info(
+        f"  전처리 완료: 오디오 {'있음' if audio_path else '없음'}, "
+        f"키프레임 후보 {len(candidates)}장 → {len(frames)}장 ({probe['duration']:.1f}초)"
+    )
+    return {"audio_path": audio_path, "frames": frames, "duration": probe["duration"]}
 
-        path = str(OUTPUTS_DIR / f"frame_{uuid.uuid4().hex[:8]}_{i}.jpg")
-        cv2.imwrite(path, frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        saved_paths.append(path)
 
-    cap.release()
-    logger.info(f"  프레임 추출: {len(saved_paths)}장 (영상 fps={fps:.1f}, step={step})")
-    return saved_paths
+# --- 3-2. Whisper API 대본 추출 ---
+# 프로세스 전체 Whisper 동시 요청 상한 (작업 여러 개가 동시에 분할 전사해도 유지)
+WHISPER_SEMAPHORE = asyncio.Semaphore(WHISPER_CONCURRENCY)
 
 
-# --- 3-2. 오디오 추출 (ffmpeg subprocess) ---
-def extract_audio(video_path: str) -> str:
-    """ffmpeg subprocess로 오디오 추출 — MoviePy 로드 오버헤드 없이 빠른 추출"""
-    audio_path = str(Path(video_path).with_suffix(".mp3"))
+def find_split_points(audio_path: str, duration: float) -> list:
+    """
+    silencedetect로 무음 구간을 찾아 약 WHISPER_CHUNK_SEC 간격의 분할 지점(초) 목록 반환
+    - 각 구간 끝에서 가장 가까운 앞쪽 무음의 중간 지점에서 자름
+    - 구간 후반부(50% 이후)에 무음이 없으면 WHISPER_CHUNK_SEC 위치에서 그대로 자름
+    """
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats", "-i", audio_path,
+         "-af", f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SEC}", "-f", "null", "-"],
+        capture_output=True,
+        text=True,
+    )
+    starts   = [float(v) for v in re.findall(r"silence_start: ([\d.]+)", result.stderr)]
+    ends     = [float(v) for v in re.findall(r"silence_end: ([\d.]+)", result.stderr)]
+    silences = [(a + b) / 2 for a, b in zip(starts, ends)]
+
+    points, cursor = [], 0.0
+    while duration - cursor > WHISPER_CHUNK_SEC:
+        limit      = cursor + WHISPER_CHUNK_SEC
+        candidates = [t for t in silences if cursor + WHISPER_CHUNK_SEC / 2 < t <= limit]
+        cursor     = candidates[-1] if candidates else limit
+        points.append(round(cursor, 3))
+    return points
+
+
+def split_audio(audio_path: str, split_points: list, chunk_dir: Path) -> list:
+    """
+    segment muxer로 재인코딩 없이(-c copy) 한 번에 분할
+    - 실제 잘린 위치는 MP3 프레임 경계로 맞춰지므로 segment_list의 시작 시각을 오프셋으로 사용
+    - 반환: [(청크 경로, 시작 오프셋 초), ...] (시간순)
+    """
+    list_path = chunk_dir / "chunks.csv"
     result = subprocess.run(
-        ["ffmpeg", "-i", video_path, "-vn", "-acodec", "libmp3lame", "-q:a", "4", "-y", audio_path],
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-i", audio_path,
+         "-f", "segment", "-segment_times", ",".join(str(t) for t in split_points),
+         "-segment_list", str(list_path), "-segment_list_type", "csv",
+         "-c", "copy", "-y", str(chunk_dir / "chunk_%03d.mp3")],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
-        logger.error(f"오디오 추출 실패: {result.stderr[-300:]}")
-        return ""
-    logger.info(f"  오디오 추출 완료: {Path(audio_path).name}")
-    return audio_path
+        raise RuntimeError(f"오디오 분할 실패: {result.stderr[-200:]}")
+
+    chunks = []
+    for line in list_path.read_text().splitlines():
+        name, start, _ = line.rsplit(",", 2)
+        chunks.append((str(chunk_dir / name), float(start)))
+    return chunks
+
+
+async def transcribe_chunk(path: str, offset: float = 0.0) -> dict:
+    """Whisper verbose_json 1회 호출 — 세그먼트 타임스탬프를 offset만큼 이동해 반환"""
+    async with WHISPER_SEMAPHORE:
+        with open(path, "rb") as f:
+            transcript = await client.audio.transcriptions.create(
+                model="whisper-1",
+                file=f,
+                language="ko",
+                response_format="verbose_json",
+            )
+
+    segments = [
+        {
+            "start": round(seg.start + offset, 2),
+            "end":   round(seg.end + offset, 2),
+            "text":  seg.text.strip(),
+        }
+        for seg in (transcript.segments or [])
+    ]
+    return {"text": transcript.text.strip(), "segments": segments}
+
 
+def compute_speech_metrics(text: str, segments: list, duration: float) -> dict:
+    """
+    Whisper 세그먼트 타임스탬프로 발화 지표 계산 (추가 디코딩/API 호출 없음)
+    - wpm: ffprobe 실제 길이 기준 분당 어절 수
+    - speech_wpm: 발화 구간만 기준으로 한 말 빠르기
+    - segment_wpm: 세그먼트별 발화 속도 분포 (0.5초 미만 세그먼트 제외)
+    - silence_ratio: 어떤 세그먼트에도 덮이지 않은 시간 비율
+    """
+    if duration <= 0 and segments:
+        duration = segments[-1]["end"]
+
+    # 겹치는 세그먼트는 합쳐서 발화 시간 계산
+    speech_sec, cursor = 0.0, 0.0
+    for seg in sorted(segments, key=lambda x: x["start"]):
+        start = max(seg["start"], cursor)
+        if seg["end"] > start:
+            speech_sec += seg["end"] - start
+        cursor = max(cursor, seg["end"])
+
+    word_count = len(text.split())
+    rates = [
+        len(seg["text"].split()) * 60 / (seg["end"] - seg["start"])
+        for seg in segments
+        if seg["end"] - seg["start"] >= 0.5
+    ]
 
-# --- 3-3. Whisper API 대본 추출 ---
-def transcribe_audio(audio_path: str) -> dict:
+    return {
+        "duration_sec":  round(duration, 1),
+        "speech_sec":    round(speech_sec, 1),
+        "silence_ratio": round(1 - min(speech_sec / duration, 1.0), 3) if duration > 0 else 0.0,
+        "wpm":           int(word_count * 60 / duration) if duration > 0 else 0,
+        "speech_wpm":    int(word_count * 60 / speech_sec) if speech_sec > 0 else 0,
+        "segment_wpm": {
+            "p10":    int(np.percentile(rates, 10)) if rates else 0,
+            "median": int(np.median(rates)) if rates else 0,
+            "p90":    int(np.percentile(rates, 90)) if rates else 0,
+        },
+    }
+
+
+async def transcribe_audio(audio_path: str, duration: float = 0.0) -> dict:
     """
     OpenAI Whisper API로 대본 추출
-    - 25MB 초과 시 ffmpeg로 16kHz/mono/32kbps 압축 후 전송
+    - preprocess_media가 이미 Whisper용 저비트레이트 오디오를 만들었으므로 그대로 전송
+    - WHISPER_CHUNK_SEC보다 긴 오디오는 무음 지점에서 분할 → WHISPER_SEMAPHORE 범위 내 병렬 전사
+      → 시간순으로 이어 붙임 (25MB 제한과 무관하게 긴 영상 처리 가능)
+    - 한 구간이라도 실패하면 나머지 구간 요청을 취소한 뒤 임시 파일 정리
+    - 세그먼트 타임스탬프 + ffprobe 길이로 WPM/무음 비율 등 발화 지표 계산
     - 전송 완료 후 임시 파일 즉시 삭제
     """
     if not audio_path or not os.path.exists(audio_path):
-        return {"text": "", "wpm": 0}
+        speech = compute_speech_metrics("", [], duration)
+        return {"text": "", "wpm": 0, "segments": [], "speech_metrics": speech}
 
     file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-    send_path    = audio_path  # 실제로 Whisper에 전송할 경로
-    compressed   = False
-
-    if file_size_mb > WHISPER_MAX_MB:
-        logger.info(f"  오디오 {file_size_mb:.1f}MB > {WHISPER_MAX_MB}MB — ffmpeg 압축 시작")
-        compressed_path = audio_path.replace(".mp3", "_compressed.mp3")
-        result = subprocess.run(
-            [
-                "ffmpeg", "-i", audio_path,
-                "-ar", "16000",   # 16kHz (음성 인식에 충분)
-                "-ac", "1",       # mono
-                "-b:a", "32k",    # 32kbps (~240kB/분)
-                "-y", compressed_path,
-            ],
-            capture_output=True,
-        )
-        if result.returncode != 0:
+    chunk_dir    = Path(audio_path).with_suffix(".chunks")
+
+    try:
+        if duration <= WHISPER_CHUNK_SEC and file_size_mb <= WHISPER_MAX_MB:
+            parts = [await transcribe_chunk(audio_path)]
+        else:
+            chunk_dir.mkdir(exist_ok=True)
+            split_points = await run_blocking(find_split_points, audio_path, duration)
+            chunks       = await run_blocking(split_audio, audio_path, split_points, chunk_dir)
+            logger.info(f"  오디오 {duration:.0f}초 → {len(chunks)}개 구간 병렬 전사 (동시 {WHISPER_CONCURRENCY})")
+            # TaskGroup — 한 구간이 실패하면 나머지 구간을 취소하고 모두 끝난 뒤에야 chunk_dir 정리로 넘어감
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(transcribe_chunk(path, offset)) for path, offset in chunks]
+            except ExceptionGroup as eg:
+                raise eg.exceptions[0] from eg  # 작업 오류 메시지에 첫 실패 원인을 그대로 노출
+            parts = [task.result() for task in tasks]
+    finally:
+        # 전송 완료 후 즉시 삭제
+        if os.path.exists(audio_path):
             os.remove(audio_path)
-            raise RuntimeError(f"오디오 압축 실패: {result.stderr[-200:]}")
+            logger.info(f"  오디오 파일 삭제: {Path(audio_path).name}")
+        shutil.rmtree(chunk_dir, ignore_errors=True)
 
-        compressed_mb = os.path.getsize(compressed_path) / (1024 * 1024)
-        logger.info(f"  압축 완료: {file_size_mb:.1f}MB → {compressed_mb:.1f}MB")
+    text     = " ".join(part["text"] for part in parts if part["text"])
+    segments = [seg for part in parts for seg in part["segments"]]
+    speech   = compute_speech_metrics(text, segments, duration)
 
-        if compressed_mb > WHISPER_MAX_MB:
-            for p in [audio_path, compressed_path]:
-                if os.path.exists(p): os.remove(p)
-            raise ValueError(f"압축 후에도 {compressed_mb:.1f}MB로 {WHISPER_MAX_MB}MB를 초과합니다. 영상을 짧게 줄여주세요.")
+    return {"text": text, "wpm": speech["wpm"], "segments": segments, "speech_metrics": speech}
 
-        send_path  = compressed_path
-        compressed = True
 
-    try:
-        with open(send_path, "rb") as f:
-            transcript = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=f,
-                language="ko",
-                response_format="text",
-            )
-    finally:
-        # 전송 완료 후 원본 + 압축본 모두 삭제
-        for p in ([audio_path, send_path] if compressed else [audio_path]):
-            if os.path.exists(p):
-                os.remove(p)
-                logger.info(f"  오디오 파일 삭제: {Path(p).name}")
+# --- 3-3. 트렌드 적합도 점수 산출 ---
+def build_analysis_context(script_text: str, category: str, frames: list = (), precomputed: dict | None = None) -> dict:
+    """
+    작업 1건의 대본 텍스트 피처를 한 번만 계산해 점수 함수들이 공유
+    - frames: preprocess_media의 메모리 JPEG 키 프레임 (대본 캐시 적중 시 캐시에서 복원)
+    - precomputed: 작업 시작 시점의 사전계산 스냅샷 (생략 시 현재 스냅샷) — 재로드와 무관하게 작업 내내 동일
+    - words: 공백 분리 단어 집합 (topic_score 겹침 계산)
+    - ngrams / query_vector: 카테고리 어휘 기준 TF-IDF 질의 (keyword_score, Novelty)
+    - category_similarity: 카테고리 평균 코사인 유사도 (인덱스 없으면 None)
+    """
+    safe_cat = category.replace(" ", "_").replace("&", "and")
+    ctx = {
+        "script_text":         script_text,
+        "category":            category,
+        "frames":              list(frames),
+        "precomputed":         PRECOMPUTED if precomputed is None else precomputed,
+        "words":               frozenset(script_text.split()),
+        "ngrams":              [],
+        "query_vector":        None,
+        "category_similarity": None,
+    }
+
+    index = ctx["precomputed"].get("index")
+    if index is not None and safe_cat in index:
+        encoder = index.encoder(safe_cat)
+        ctx["ngrams"]              = encoder.ngrams(script_text)
+        ctx["query_vector"]        = encoder.encode(ctx["ngrams"])
+        ctx["category_similarity"] = index.mean_similarity(safe_cat, ctx["query_vector"])
+
+    return ctx
+
+
+# 키 프레임 시각 평가 — GPT-4o 이미지 입력용 축소 크기 / 로컬 fallback 특징
+VISION_FRAME_SIDE = 512  # detail="low" 기준 해상도 (이미지당 고정 토큰)
 
-    text          = transcript if isinstance(transcript, str) else transcript.text
-    word_count    = len(text.split())
-    est_minutes   = file_size_mb / 1.5  # 원본 크기 기준 WPM 추정
-    wpm           = int(word_count / max(est_minutes, 0.1))
 
-    return {"text": text, "wpm": wpm}
+def encode_vision_frame(frame: bytes) -> str:
+    """키 프레임 JPEG를 VISION_FRAME_SIDE 이하로 축소해 data URL로 변환"""
+    with Image.open(io.BytesIO(frame)) as img:
+        img.draft("RGB", (VISION_FRAME_SIDE, VISION_FRAME_SIDE))
+        img = img.convert("RGB")
+        img.thumbnail((VISION_FRAME_SIDE, VISION_FRAME_SIDE))
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=80)
+    return "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode()
 
 
-# --- 3-4. 트렌드 적합도 점수 산출 ---
-async def calculate_trend_score(script_text: str, category: str) -> dict:
+# CascadeClassifier는 스레드 안전이 보장되지 않으므로 MEDIA_EXECUTOR 스레드마다 따로 로드해 재사용
+_FACE_CASCADE_LOCAL = threading.local()
+
+
+def _face_cascade():
+    cascade = getattr(_FACE_CASCADE_LOCAL, "cascade", None)
+    if cascade is None:
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+        _FACE_CASCADE_LOCAL.cascade = cascade
+    return cascade
+
+
+def frame_visual_features(frame: bytes) -> dict:
+    """
+    썸네일 소재로서의 프레임 특징 (CPU, 절반 해상도 디코딩 기준 프레임당 수 ms)
+    - colorfulness: Hasler & Süsstrunk 색채도 (rg/yb 대립색 표준편차 + 평균)
+    - contrast: 그레이 밝기 표준편차
+    - face_area: Haar 정면 얼굴 검출 영역 비율
+    - text_area: 모폴로지 그래디언트 → 가로 닫힘으로 찾은 글자 줄 영역 비율
+    """
+    img = cv2.imdecode(np.frombuffer(frame, np.uint8), cv2.IMREAD_REDUCED_COLOR_2)
+    if img is None:
+        return {}
+    h, w = img.shape[:2]
+    area = float(h * w)
+
+    b, g, r = (c.astype(np.float32) for c in cv2.split(img))
+    rg, yb  = r - g, 0.5 * (r + g) - b
+    colorfulness = np.hypot(rg.std(), yb.std()) + 0.3 * np.hypot(rg.mean(), yb.mean())
+
+    gray  = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    faces = _face_cascade().detectMultiScale(gray, scaleFactor=1.2, minNeighbors=5, minSize=(24, 24))
+    face_area = sum(fw * fh for _, _, fw, fh in faces) / area
+
+    grad      = cv2.morphologyEx(gray, cv2.MORPH_GRADIENT, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)))
+    _, binary = cv2.threshold(grad, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    closed    = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1)))
+    contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    text_area = 0.0
+    for cnt in contours:
+        x, y, cw, ch = cv2.boundingRect(cnt)
+        if cw > 2 * ch and 8 <= ch <= h / 4 and cv2.countNonZero(binary[y:y + ch, x:x + cw]) > 0.45 * cw * ch:
+            text_area += cw * ch
+    text_area /= area
+
+    return {
+        "colorfulness": float(colorfulness),
+        "contrast":     float(gray.std()),
+        "face_area":    float(face_area),
+        "text_area":    float(text_area),
+    }
+
+
+def local_visual_score(frames: list) -> int | None:
+    """
+    GPT-4o 실패 시 키 프레임 기반 visual_score (0~100, 프레임 없으면 None)
+    - 색채도 35% + 대비 25% + 얼굴 25% + 텍스트 15%, 썸네일 후보로 가장 좋은 프레임 기준
+    """
+    best = None
+    for frame in frames:
+        feat = frame_visual_features(frame)
+        if not feat:
+            continue
+        score = 100 * (
+            0.35 * min(feat["colorfulness"] / 80, 1.0)
+            + 0.25 * min(feat["contrast"] / 64, 1.0)
+            + 0.25 * min(feat["face_area"] / 0.1, 1.0)
+            + 0.15 * min(feat["text_area"] / 0.15, 1.0)
+        )
+        best = score if best is None else max(best, score)
+    return None if best is None else int(best)
+
+
+async def calculate_trend_score(ctx: dict) -> dict:
     """
     GPT-4o 기반 트렌드 적합도 점수 산출 (TF-IDF fallback 포함)
+    - 키 프레임이 있으면 같은 호출에 축소 이미지로 첨부 → visual_score를 실제 장면 기준으로 평가
+    - fallback의 visual_score는 로컬 OpenCV 프레임 특징으로 계산
     Coverage/Novelty 편향 보정 포함
     """
+    script_text = ctx["script_text"]
+    category    = ctx["category"]
+    frames      = ctx["frames"]
+    precomputed = ctx["precomputed"]
     scores = {}
 
     # --- GPT-4o 기반 점수 산출 ---
     try:
-        top_titles      = PRECOMPUTED.get("top_titles", {}).get(category, [])
+        top_titles      = precomputed.get("top_titles", {}).get(category, [])
         top_titles_text = "\n".join(f"{i+1}. {t}" for i, t in enumerate(top_titles[:20])) if top_titles else "데이터 없음"
+        visual_guide    = (
+            f"첨부된 영상 키 프레임 {len(frames)}장의 구도·색감·인물·텍스트가 클릭을 부르는 썸네일 소재로 적합한지 한 줄 평가"
+            if frames else
+            "영상 내용이 시각적으로 매력적인 썸네일을 만들기 좋은 소재인지 한 줄 평가"
+        )
 
         prompt = f"""당신은 유튜브 콘텐츠 트렌드 분석 전문가입니다.
 아래 영상 대본과 현재 '{category}' 카테고리의 인기 영상 제목을 비교 분석하여
@@ -321,14 +1181,21 @@ async def calculate_trend_score(script_text: str, category: str) -> dict:
   "topic_score": 0~100,
   "topic_comment": "영상 주제가 현재 인기 콘텐츠 방향과 얼마나 일치하는지 한 줄 평가",
   "visual_score": 0~100,
-  "visual_comment": "영상 내용이 시각적으로 매력적인 썸네일을 만들기 좋은 소재인지 한 줄 평가",
+  "visual_comment": "{visual_guide}",
   "total_comment": "종합 평가 한 줄"
 }}"""
 
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
+        if frames:
+            image_urls = await asyncio.gather(*(run_blocking(encode_vision_frame, f) for f in frames))
+            message    = [{"type": "text", "text": prompt}] + [
+                {"type": "image_url", "image_url": {"url": url, "detail": "low"}} for url in image_urls
+            ]
+        else:
+            message = prompt
+
+        response = await client.chat.completions.create(
             model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
+            messages=[{"role": "user", "content": message}],
             temperature=0.3,
             max_tokens=500,
         )
@@ -336,38 +1203,25 @@ async def calculate_trend_score(script_text: str, category: str) -> dict:
         content    = content.replace("```json", "").replace("```", "").strip()
         gpt_result = json.loads(content)
 
-        def _normalize(v) -> int:
-            return int(70 + (max(0, min(100, int(v))) / 100) * 30)
-
-        scores["keyword_score"]   = _normalize(gpt_result.get("keyword_score", 50))
-        scores["topic_score"]     = _normalize(gpt_result.get("topic_score", 50))
-        scores["visual_score"]    = _normalize(gpt_result.get("visual_score", 50))
-        scores["keyword_comment"] = gpt_result.get("keyword_comment", "")
-        scores["topic_comment"]   = gpt_result.get("topic_comment", "")
-        scores["visual_comment"]  = gpt_result.get("visual_comment", "")
-        scores["comment"]         = gpt_result.get("total_comment", "")
+        scores = gpt_trend_scores(gpt_result)
         logger.info("  GPT-4o 트렌드 점수 산출 완료")
 
     except Exception as e:
         logger.warning(f"  GPT-4o 트렌드 점수 실패, TF-IDF fallback 사용: {e}")
 
         # --- TF-IDF fallback ---
-        safe_cat = category.replace(" ", "_").replace("&", "and")
-        if safe_cat in PRECOMPUTED.get("vectorizer", {}):
-            vectorizer     = PRECOMPUTED["vectorizer"][safe_cat]
-            category_tfidf = PRECOMPUTED["tfidf"][safe_cat]
-            user_tfidf     = vectorizer.transform([script_text])
-            sim            = cosine_similarity(user_tfidf, category_tfidf).mean()
+        sim = ctx["category_similarity"]
+        if sim is not None:
             scores["keyword_score"] = min(int(sim * 100 * 2.5), 100)
         else:
             scores["keyword_score"] = 50
 
-        scores["visual_score"] = 50
+        visual = await run_blocking(local_visual_score, frames) if frames else None
+        scores["visual_score"] = visual if visual is not None else 50
 
-        if category in PRECOMPUTED.get("top_titles", {}):
-            top_text   = " ".join(PRECOMPUTED["top_titles"][category])
-            user_words = set(script_text.split())
-            top_words  = set(top_text.split())
+        if category in precomputed.get("top_title_words", {}):
+            user_words = ctx["words"]
+            top_words  = precomputed["top_title_words"][category]
             if top_words:
                 overlap = len(user_words & top_words) / max(len(user_words), 1)
                 scores["topic_score"] = min(int(overlap * 100 * 3), 100)
@@ -388,41 +1242,51 @@ async def calculate_trend_score(script_text: str, category: str) -> dict:
         else:
             scores["comment"] = "현재 트렌드와의 차이가 큽니다. 키워드 전략과 썸네일 스타일 재검토를 권장합니다."
 
-    # 종합 점수 (가중합)
+    return finalize_trend_score(scores, ctx)
+
+
+def gpt_trend_scores(gpt_result: dict) -> dict:
+    """GPT-4o 응답의 0~100 점수를 70~100 구간으로 정규화 + 코멘트 정리"""
+    def _normalize(v) -> int:
+        return int(70 + (max(0, min(100, int(v))) / 100) * 30)
+
+    return {
+        "keyword_score":   _normalize(gpt_result.get("keyword_score", 50)),
+        "topic_score":     _normalize(gpt_result.get("topic_score", 50)),
+        "visual_score":    _normalize(gpt_result.get("visual_score", 50)),
+        "keyword_comment": gpt_result.get("keyword_comment", ""),
+        "topic_comment":   gpt_result.get("topic_comment", ""),
+        "visual_comment":  gpt_result.get("visual_comment", ""),
+        "comment":         gpt_result.get("total_comment", ""),
+    }
+
+
+def finalize_trend_score(scores: dict, ctx: dict, bias: dict | None = None) -> dict:
+    """종합 점수(가중합) + 편향 보정 지표 추가 (bias를 이미 계산했다면 재사용)"""
     weights = {"keyword_score": 0.4, "visual_score": 0.3, "topic_score": 0.3}
     scores["total"] = int(sum(scores[k] * weights[k] for k in weights))
 
     # 편향 보정 지표 (TF-IDF 기반 유지)
-    scores["bias_metrics"] = calculate_bias_metrics(script_text, category)
+    scores["bias_metrics"] = bias if bias is not None else calculate_bias_metrics(ctx)
 
     return scores
 
 
-def calculate_bias_metrics(script_text: str, category: str) -> dict:
+def calculate_bias_metrics(ctx: dict) -> dict:
     """Coverage & Novelty 편향 보정 지표"""
-    if "df" not in PRECOMPUTED:
+    category    = ctx["category"]
+    precomputed = ctx["precomputed"]
+    if "stats" not in precomputed:
         return {"coverage": 0, "novelty": 0, "bias_warning": None}
 
-    df     = PRECOMPUTED["df"]
-    cat_df = df[df["category_name"] == category] if category in df["category_name"].values else df
-
-    # Coverage
-    if len(cat_df) > 0:
-        all_tags   = cat_df["tags"].fillna("").str.split("|").explode()
-        unique_tags = all_tags[all_tags != ""].nunique()
-        total_tags  = len(all_tags[all_tags != ""])
-        coverage    = round(unique_tags / max(total_tags, 1) * 100, 1)
-    else:
-        coverage = 0
+    # Coverage (precompute의 태그 통계 조회 — 미등록 카테고리는 전체 데이터 기준)
+    tag_stats = precomputed["stats"].get(category) or precomputed.get("tag_stats_all", {})
+    coverage  = tag_stats.get("tag_coverage", 0)
 
     # Novelty
-    safe_cat = category.replace(" ", "_").replace("&", "and")
-    if safe_cat in PRECOMPUTED.get("vectorizer", {}):
-        vectorizer     = PRECOMPUTED["vectorizer"][safe_cat]
-        category_tfidf = PRECOMPUTED["tfidf"][safe_cat]
-        user_tfidf     = vectorizer.transform([script_text])
-        avg_sim        = float(cosine_similarity(user_tfidf, category_tfidf).flatten().mean())
-        novelty        = round((1 - avg_sim) * 100, 1)
+    avg_sim = ctx["category_similarity"]
+    if avg_sim is not None:
+        novelty = round((1 - avg_sim) * 100, 1)
     else:
         novelty = 50
 
@@ -433,11 +1297,12 @@ def calculate_bias_metrics(script_text: str, category: str) -> dict:
     }
 
 
-# --- 3-5. GPT-4o 제목 추천 ---
-async def generate_titles(script_text: str, category: str, custom_prompt: str) -> list:
-    top_titles      = PRECOMPUTED.get("top_titles", {}).get(category, [])
+# --- 3-4. GPT-4o 제목 추천 ---
+async def generate_titles(script_text: str, category: str, custom_prompt: str, precomputed: dict | None = None) -> list:
+    precomputed     = PRECOMPUTED if precomputed is None else precomputed
+    top_titles      = precomputed.get("top_titles", {}).get(category, [])
     top_titles_text = "\n".join(top_titles[:10]) if top_titles else "데이터 없음"
-    stats           = PRECOMPUTED.get("stats", {}).get(category, {})
+    stats           = precomputed.get("stats", {}).get(category, {})
     stats_text      = f"평균 조회수: {stats.get('avg_views', 'N/A'):,}" if stats else ""
 
     prompt = f"""당신은 유튜브 콘텐츠 전략 전문가입니다.
@@ -468,7 +1333,7 @@ async def generate_titles(script_text: str, category: str, custom_prompt: str) -
 ]"""
 
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.8,
@@ -482,12 +1347,13 @@ async def generate_titles(script_text: str, category: str, custom_prompt: str) -
         return [{"style": "오류", "title": "제목 생성에 실패했습니다", "why": str(e)}]
 
 
-# --- 3-6. DALL-E 3 썸네일 생성 ---
-async def generate_thumbnails(script_text: str, category: str, custom_prompt: str) -> list:
+# --- 3-5. DALL-E 3 썸네일 생성 ---
+async def generate_thumbnails(script_text: str, category: str, custom_prompt: str, on_thumbnail=None, keywords: str = "") -> list:
     """
     DALL-E 3 3종 썸네일을 asyncio.gather로 병렬 생성
-    - 키워드 추출 1회 후 3개 DALL-E 호출을 동시에 실행
-    - 동기 OpenAI/requests 호출은 asyncio.to_thread로 thread pool에 위임
+    - 키워드 추출 1회 후 3개 DALL-E 호출을 동시에 실행 (keywords가 주어지면 추출 생략)
+    - AsyncOpenAI/httpx 비동기 호출이므로 스레드 풀 없이 이벤트 루프에서 동시 진행
+    - on_thumbnail: 썸네일 1장이 끝날 때마다 await (부분 결과 전달용, 완료 순서)
     """
     styles = [
         {"name": "강렬한 클릭 유도형", "prompt_suffix": "Bold, high-contrast colors with large dramatic text overlay. Eye-catching YouTube thumbnail."},
@@ -496,16 +1362,16 @@ async def generate_thumbnails(script_text: str, category: str, custom_prompt: st
     ]
 
     # 키워드 추출 (1회, 이후 3개 DALL-E 호출에 공유)
-    try:
-        kw_resp  = await asyncio.to_thread(
-            client.chat.completions.create,
-            model="gpt-4o",
-            messages=[{"role": "user", "content": f"다음 영상 대본에서 썸네일에 넣을 핵심 키워드 3개를 영어로 추출하세요. 키워드만 쉼표로 구분하여 답하세요:\n\n{script_text[:1000]}"}],
-            max_tokens=50,
-        )
-        keywords = kw_resp.choices[0].message.content.strip()
-    except Exception:
-        keywords = category
+    if not keywords:
+        try:
+            kw_resp  = await client.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": f"다음 영상 대본에서 썸네일에 넣을 핵심 키워드 3개를 영어로 추출하세요. 키워드만 쉼표로 구분하여 답하세요:\n\n{script_text[:1000]}"}],
+                max_tokens=50,
+            )
+            keywords = kw_resp.choices[0].message.content.strip()
+        except Exception:
+            keywords = category
 
     async def _one_thumbnail(style: dict) -> dict:
         """단일 스타일 썸네일 생성 — DALL-E 호출 + 이미지 다운로드"""
@@ -513,8 +1379,7 @@ async def generate_thumbnails(script_text: str, category: str, custom_prompt: st
         if custom_prompt:
             base_prompt += f" Additional request: {custom_prompt}"
         try:
-            response  = await asyncio.to_thread(
-                client.images.generate,
+            response  = await client.images.generate(
                 model="dall-e-3",
                 prompt=base_prompt,
                 size="1792x1024",
@@ -522,7 +1387,8 @@ async def generate_thumbnails(script_text: str, category: str, custom_prompt: st
                 n=1,
             )
             image_url = response.data[0].url
-            img_resp  = await asyncio.to_thread(http_requests.get, image_url, timeout=30)
+            img_resp  = await http_client.get(image_url)
+            img_resp.raise_for_status()
             filename  = f"thumb_{uuid.uuid4().hex[:8]}.png"
             with open(OUTPUTS_DIR / filename, "wb") as f:
                 f.write(img_resp.content)
@@ -531,13 +1397,24 @@ async def generate_thumbnails(script_text: str, category: str, custom_prompt: st
             logger.error(f"썸네일 생성 실패 ({style['name']}): {e}")
             return {"style": style["name"], "filename": None, "url": None, "prompt": base_prompt, "error": str(e)}
 
-    # 3개 동시 실행
-    results = await asyncio.gather(*[_one_thumbnail(s) for s in styles])
+    async def _notify(style: dict) -> dict:
+        thumb = await _one_thumbnail(style)
+        if on_thumbnail is not None:
+            await on_thumbnail(thumb)
+        return thumb
+
+    # 3개 동시 실행 (반환은 스타일 순서)
+    results = await asyncio.gather(*[_notify(s) for s in styles])
     return list(results)
 
 
-# --- 3-7. AI 상세 분석 리포트 ---
-async def generate_report(script_text: str, score: dict, category: str) -> str:
+# --- 3-6. AI 상세 분석 리포트 ---
+async def generate_report(script_text: str, score: dict, category: str, on_chunk=None) -> str:
+    """
+    GPT-4o 상세 컨설팅 리포트
+    - on_chunk가 있으면 스트리밍 생성: 토큰이 도착할 때마다 지금까지의 누적 텍스트로 await
+    - 최종 반환값은 스트리밍 여부와 관계없이 동일 (전체 응답 .strip())
+    """
     prompt = f"""당신은 유튜브 콘텐츠 전략 컨설턴트입니다.
 아래 영상 분석 결과를 바탕으로 상세 컨설팅 리포트를 한국어로 작성하세요.
 
@@ -559,99 +1436,470 @@ async def generate_report(script_text: str, score: dict, category: str) -> str:
 4. 참신성(Novelty) 평가 — 기존 인기 영상 대비 이 영상만의 차별점"""
 
     try:
-        response = client.chat.completions.create(
+        if on_chunk is None:
+            response = await client.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7,
+                max_tokens=1500,
+            )
+            return response.choices[0].message.content.strip()
+
+        stream = await client.chat.completions.create(
             model="gpt-4o",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
             max_tokens=1500,
+            stream=True,
         )
-        return response.choices[0].message.content.strip()
+        pieces = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                pieces.append(delta)
+                await on_chunk("".join(pieces))
+        return "".join(pieces).strip()
     except Exception as e:
         logger.error(f"리포트 생성 실패: {e}")
-        return f"리포트 생성 중 오류가 발생했습니다: {e}"
+        return f"{REPORT_ERROR_PREFIX}: {e}"
+
+
+# --- 3-7. 단일 호출 모드 (점수 + 제목 + 썸네일 키워드 + 리포트) ---
+TITLE_STYLES = ["강렬한 클릭 유도형", "감성 스토리형", "깔끔한 정보형"]
+
+SINGLE_SHOT_SCHEMA = {
+    "type": "object",
+    "additionalProperties": False,
+    "required": [
+        "keyword_score", "keyword_comment", "topic_score", "topic_comment",
+        "visual_score", "visual_comment", "total_comment", "titles", "thumbnail_keywords", "report",
+    ],
+    "properties": {
+        "keyword_score":   {"type": "integer"},
+        "keyword_comment": {"type": "string"},
+        "topic_score":     {"type": "integer"},
+        "topic_comment":   {"type": "string"},
+        "visual_score":    {"type": "integer"},
+        "visual_comment":  {"type": "string"},
+        "total_comment":   {"type": "string"},
+        "titles": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["style", "title", "why"],
+                "properties": {
+                    "style": {"type": "string", "enum": TITLE_STYLES},
+                    "title": {"type": "string"},
+                    "why":   {"type": "string"},
+                },
+            },
+        },
+        "thumbnail_keywords": {"type": "string"},
+        "report":             {"type": "string"},
+    },
+}
+
+
+def check_single_shot(data) -> None:
+    """단일 호출 응답 검증 — 스키마(타입·필수 키) + 점수 범위 + 제목 3종, 위반 시 ValueError"""
+    if not isinstance(data, dict):
+        raise ValueError("응답이 객체가 아닙니다")
+    for key, spec in SINGLE_SHOT_SCHEMA["properties"].items():
+        expected = {"integer": int, "string": str, "array": list}[spec["type"]]
+        if not isinstance(data.get(key), expected) or isinstance(data.get(key), bool):
+            raise ValueError(f"{key} 필드 누락 또는 타입 오류")
+    for key in ("keyword_score", "topic_score", "visual_score"):
+        if not 0 <= data[key] <= 100:
+            raise ValueError(f"{key} 범위 오류: {data[key]}")
+    if sorted(t.get("style") for t in data["titles"] if isinstance(t, dict)) != sorted(TITLE_STYLES):
+        raise ValueError("제목 3종 스타일 불일치")
+    if not all(isinstance(t.get(k), str) and t[k] for t in data["titles"] for k in ("title", "why")):
+        raise ValueError("제목/근거 누락")
+    if not data["report"].strip() or not data["thumbnail_keywords"].strip():
+        raise ValueError("리포트/키워드 누락")
+
+
+async def generate_single_shot(ctx: dict, custom_prompt: str) -> dict | None:
+    """
+    GPT-4o 1회(json_schema 구조화 출력)로 점수·제목·썸네일 키워드·리포트를 함께 생성
+    - 대본/인기 제목/키 프레임을 한 번만 전송 (분할 호출 4회 대비 입력 토큰·왕복 감소)
+    - 검증 실패·호출 오류 시 None → 호출 측에서 분할 호출로 fallback
+    """
+    script_text = ctx["script_text"]
+    category    = ctx["category"]
+    frames      = ctx["frames"]
+    bias        = calculate_bias_metrics(ctx)
+
+    top_titles      = ctx["precomputed"].get("top_titles", {}).get(category, [])
+    top_titles_text = "\n".join(f"{i+1}. {t}" for i, t in enumerate(top_titles[:20])) if top_titles else "데이터 없음"
+    stats           = ctx["precomputed"].get("stats", {}).get(category, {})
+    stats_text      = f"평균 조회수: {stats.get('avg_views', 'N/A'):,}" if stats else ""
+
+    prompt = f"""당신은 유튜브 콘텐츠 트렌드 분석가이자 전략 컨설턴트입니다.
+아래 영상 대본과 현재 '{category}' 카테고리의 인기 영상 데이터를 분석하여 다음을 한 번에 작성하세요.
+
+[영상 대본]
+{script_text[:3000]}
+
+[인기 영상 제목 Top 20]
+{top_titles_text}
+
+[카테고리 통계]
+{stats_text}
+
+[Coverage] {bias['coverage']}%
+[Novelty]  {bias['novelty']}%
+
+{f'[사용자 추가 요청] {custom_prompt}' if custom_prompt else ''}
+
+1. 트렌드 적합도 (각 0~100 정수 + 한 줄 평가)
+   - keyword_score: 대본의 키워드가 트렌드 키워드와 얼마나 부합하는지
+   - topic_score: 영상 주제가 현재 인기 콘텐츠 방향과 얼마나 일치하는지
+   - visual_score: {f"첨부된 영상 키 프레임 {len(frames)}장의 구도·색감·인물·텍스트가 클릭을 부르는 썸네일 소재로 적합한지" if frames else "영상 내용이 시각적으로 매력적인 썸네일을 만들기 좋은 소재인지"}
+   - total_comment: 종합 평가 한 줄
+2. titles: 클릭률(CTR)을 극대화할 제목 3종과 각 WHY 근거 한 줄
+   - 강렬한 클릭 유도형 (호기심 자극, 의문문/숫자 활용)
+   - 감성 스토리형 (감정적 공감, 스토리텔링)
+   - 깔끔한 정보형 (명확한 정보 전달)
+3. thumbnail_keywords: 썸네일에 넣을 핵심 키워드 3개 (영어, 쉼표 구분)
+4. report: 위 평가와 일관된 한국어 상세 컨설팅 리포트
+   1) 영상 강점 (2~3가지)
+   2) 개선이 필요한 부분 (2~3가지)
+   3) 구체적 개선 방향 (행동 가능한 제안 3가지)
+   4) 참신성(Novelty) 평가 — 기존 인기 영상 대비 이 영상만의 차별점"""
+
+    try:
+        if frames:
+            image_urls = await asyncio.gather(*(run_blocking(encode_vision_frame, f) for f in frames))
+            message    = [{"type": "text", "text": prompt}] + [
+                {"type": "image_url", "image_url": {"url": url, "detail": "low"}} for url in image_urls
+            ]
+        else:
+            message = prompt
+
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": message}],
+            temperature=0.5,
+            max_tokens=3000,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "video_analysis", "strict": True, "schema": SINGLE_SHOT_SCHEMA},
+            },
+        )
+        data = json.loads(response.choices[0].message.content)
+        check_single_shot(data)
+    except Exception as e:
+        logger.warning(f"  단일 호출 모드 실패, 분할 호출로 fallback: {e}")
+        return None
+
+    order = {style: i for i, style in enumerate(TITLE_STYLES)}
+    logger.info("  GPT-4o 단일 호출 (점수·제목·키워드·리포트) 완료")
+    return {
+        "score":    finalize_trend_score(gpt_trend_scores(data), ctx, bias),
+        "titles":   sorted(data["titles"], key=lambda t: order[t["style"]]),
+        "keywords": data["thumbnail_keywords"].strip(),
+        "report":   data["report"].strip(),
+    }
+
+
+# --- 3-8. 콘텐츠 주소 기반 결과 캐시 ---
+REPORT_ERROR_PREFIX = "리포트 생성 중 오류가 발생했습니다"
+
+
+class ResultCache:
+    """
+    업로드 영상 SHA-256을 키로 하는 디스크 캐시 (재업로드·재시도 시 API 비용 0)
+    - transcripts/{video}.json         : 대본 + 키 프레임(base64 JPEG) 계층 — 영상 내용에만 의존 (ffmpeg + Whisper 생략)
+    - results/{video+category+prompt}/ : 분석 결과 계층 — result.json + 썸네일 이미지
+    - 적중 시 mtime 갱신(LRU), prune()이 CACHE_MAX_AGE_DAYS 초과 → CACHE_MAX_MB 초과 순으로 제거
+    """
+
+    def __init__(self, root: Path, max_mb: int, max_age_days: float):
+        self.transcripts = root / "transcripts"
+        self.results     = root / "results"
+        self.max_bytes   = max_mb * 1024 * 1024
+        self.max_age_sec = max_age_days * 86400
+        for d in (self.transcripts, self.results):
+            d.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def result_key(content_hash: str, category: str, custom_prompt: str, generation: str = "") -> str:
+        """generation: 사전계산 세대 — 트렌드 데이터가 갱신되면 이전 분석 결과는 적중하지 않음"""
+        return hashlib.sha256(f"{content_hash}\0{category}\0{custom_prompt}\0{generation}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _read_json(path: Path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # LRU 갱신
+        return data
+
+    @staticmethod
+    def _write_json(path: Path, data):
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    # 대본 계층
+    def get_transcript(self, content_hash: str) -> dict | None:
+        return self._read_json(self.transcripts / f"{content_hash}.json")
+
+    def put_transcript(self, content_hash: str, entry: dict):
+        self._write_json(self.transcripts / f"{content_hash}.json", entry)
+
+    # 분석 결과 계층
+    def get_result(self, key: str) -> dict | None:
+        """캐시된 결과 반환 — 썸네일은 OUTPUTS_DIR에 새 파일명으로 복원"""
+        entry_dir = self.results / key
+        result    = self._read_json(entry_dir / "result.json")
+        if result is None:
+            return None
+
+        for thumb in result.get("thumbnails", []):
+            cached_file = entry_dir / thumb["filename"]
+            if not cached_file.exists():
+                return None
+            filename = f"thumb_{uuid.uuid4().hex[:8]}.png"
+            shutil.copyfile(cached_file, OUTPUTS_DIR / filename)
+            thumb.update({"filename": filename, "url": f"/outputs/{filename}"})
+        os.utime(entry_dir)
+        return result
+
+    def put_result(self, key: str, result: dict):
+        """성공한 결과만 저장 (오류가 섞인 결과는 재시도 시 다시 생성되도록 제외)"""
+        if not self.is_cacheable(result):
+            return
+        entry_dir = self.results / key
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        for thumb in result["thumbnails"]:
+            shutil.copyfile(OUTPUTS_DIR / thumb["filename"], entry_dir / thumb["filename"])
+        self._write_json(entry_dir / "result.json", result)
+
+    @staticmethod
+    def is_cacheable(result: dict) -> bool:
+        return (
+            all(t.get("filename") for t in result.get("thumbnails", []))
+            and not any(t.get("style") == "오류" for t in result.get("titles", []))
+            and not result.get("report", "").startswith(REPORT_ERROR_PREFIX)
+        )
+
+    # 용량/기간 기반 정리
+    def prune(self):
+        """만료 항목 삭제 후 총 용량이 상한 이하가 될 때까지 오래 안 쓰인 항목부터 삭제"""
+        entries = []
+        for path in list(self.transcripts.glob("*.json")) + [d for d in self.results.iterdir() if d.is_dir()]:
+            files = [path] if path.is_file() else [f for f in path.iterdir() if f.is_file()]
+            size  = sum(f.stat().st_size for f in files)
+            entries.append((path.stat().st_mtime, size, path))
+
+        now     = time.time()
+        total   = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if now - mtime <= self.max_age_sec and total <= self.max_bytes:
+                break
+            shutil.rmtree(path) if path.is_dir() else path.unlink()
+            total   -= size
+            removed += 1
+        if removed:
+            logger.info(f"결과 캐시 {removed}건 정리 (현재 {total / (1024 * 1024):.1f}MB)")
+
+
+result_cache = ResultCache(CACHE_DIR, CACHE_MAX_MB, CACHE_MAX_AGE_DAYS)
 
 
 # ============================================================
-# 4. 완료 작업 자동 정리 (1시간 후)
+# 4. 작업 만료 + 작업 범위 파일 정리 (janitor)
 # ============================================================
 def cleanup_old_jobs():
-    """완료/실패된 작업을 1시간 후 JOBS 딕셔너리에서 제거"""
-    now = datetime.now()
-    expired = [
-        jid for jid, job in JOBS.items()
-        if job["status"] in ("completed", "failed")
-        and datetime.fromisoformat(job["created_at"]) < now - timedelta(hours=1)
-    ]
-    for jid in expired:
-        del JOBS[jid]
-    if expired:
-        logger.info(f"만료 작업 {len(expired)}건 정리 완료")
+    """만료 시각(expires_at)이 지난 작업을 작업 저장소에서 제거"""
+    removed = job_store.sweep()
+    if removed:
+        logger.info(f"만료 작업 {removed}건 정리 완료")
+
+
+def sweep_job_files() -> int:
+    """
+    살아있는 작업이 참조하지 않는 outputs/uploads 파일 삭제, 삭제 개수 반환
+    - outputs: 결과/부분 결과 썸네일은 해당 작업이 만료될 때까지만 유지 (결과 캐시에는 별도 사본 보관)
+    - uploads: 대기/처리 중 작업의 영상·오디오·분할 청크({job_id}_*)만 유지
+    - 생성 직후 아직 작업 결과에 기록되지 않은 파일 보호를 위해 JANITOR_GRACE_SEC 지난 파일만 대상
+    """
+    cutoff     = time.time() - JANITOR_GRACE_SEC
+    live       = job_store.items()
+    referenced = {
+        thumb.get("filename")
+        for _, job in live
+        for thumb in (job.get("result") or job.get("partial") or {}).get("thumbnails", [])
+    }
+    active = {jid for jid, job in live if job["status"] in ("queued", "processing")}
+
+    stale = [p for p in OUTPUTS_DIR.iterdir() if p.name not in referenced]
+    stale += [p for p in UPLOADS_DIR.iterdir() if p.name.split("_", 1)[0] not in active]
+
+    removed = 0
+    for path in stale:
+        if path.name.startswith("."):  # .gitkeep 등
+            continue
+        try:
+            if path.stat().st_mtime > cutoff:
+                continue
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+async def janitor_loop():
+    """JANITOR_INTERVAL_SEC마다 만료 작업 제거 → 참조가 끊긴 파일 정리"""
+    while True:
+        await asyncio.sleep(JANITOR_INTERVAL_SEC)
+        try:
+            await run_io(cleanup_old_jobs)
+            removed = await run_io(sweep_job_files)
+            if removed:
+                logger.info(f"작업 파일 {removed}개 정리 완료")
+        except Exception as e:
+            logger.error(f"정리 작업 오류: {e}")
 
 
 # ============================================================
 # 5. 백그라운드 분석 파이프라인
 # ============================================================
 async def run_analysis_pipeline(job_id: str, video_path: str, category: str, custom_prompt: str):
-    audio_path = ""
+    audio_path   = ""
+    frames       = []
+    precomputed  = PRECOMPUTED  # 작업 시작 시점 스냅샷 — 도중에 재로드돼도 이 작업은 끝까지 같은 데이터 사용
+    job          = await update_job(job_id, status="processing", progress="영상 전처리 중...")
+    content_hash = job.get("content_hash") if CACHE_ENABLED and job else None
     try:
-        JOBS[job_id]["status"]   = "processing"
-        JOBS[job_id]["progress"] = "영상 전처리 중..."
-
-        # Phase 1: 프레임 추출 + 오디오 분리
-        logger.info(f"[{job_id}] Phase 1: 영상 전처리")
-        frame_paths = extract_key_frames(video_path)
-        audio_path  = extract_audio(video_path)
 
-        # 영상 파일 즉시 삭제 (오디오 추출 완료 후)
-        if os.path.exists(video_path):
-            os.remove(video_path)
-            logger.info(f"[{job_id}] 영상 파일 삭제 완료")
-
-        JOBS[job_id]["progress"] = "음성 분석 중..."
+        cached = await run_io(result_cache.get_transcript, content_hash) if content_hash else None
+        if cached is not None and "frames" in cached:
+            # 같은 영상의 대본 캐시 적중 — Phase 1~2 생략, 키 프레임도 캐시에서 복원해 시각 평가 유지
+            logger.info(f"[{job_id}] 대본 캐시 적중 — 전처리/Whisper 생략")
+            transcript  = cached["transcript"]
+            frames      = [base64.b64decode(f) for f in cached["frames"]]
+            frame_count = len(frames)
+        else:
+            # Phase 1: 단일 디코딩 패스로 프레임 + Whisper용 오디오 추출
+            logger.info(f"[{job_id}] Phase 1: 영상 전처리")
+            media       = await run_blocking(preprocess_media, video_path)
+            audio_path  = media["audio_path"]
+            frames      = media["frames"]
+            frame_count = len(frames)
+
+            # 영상 파일 즉시 삭제 (오디오 추출 완료 후)
+            if os.path.exists(video_path):
+                os.remove(video_path)
+                logger.info(f"[{job_id}] 영상 파일 삭제 완료")
+
+            await update_job(job_id, progress="음성 분석 중...")
+
+            # Phase 2: Whisper API (내부에서 오디오 파일 삭제)
+            logger.info(f"[{job_id}] Phase 2: Whisper API")
+            transcript = await transcribe_audio(audio_path, media["duration"])
+            audio_path = ""  # 이미 삭제됨
+            if content_hash:
+                await run_io(result_cache.put_transcript, content_hash, {
+                    "transcript": transcript,
+                    "frames":     [base64.b64encode(f).decode("ascii") for f in frames],  # 최대 640px JPEG, 장당 수십 KB
+                })
 
-        # Phase 2: Whisper API (내부에서 오디오 파일 삭제)
-        logger.info(f"[{job_id}] Phase 2: Whisper API")
-        transcript  = transcribe_audio(audio_path)
-        audio_path  = ""  # 이미 삭제됨
         script_text = transcript["text"]
 
-        JOBS[job_id]["progress"] = "트렌드 분석 중..."
+        await update_job(job_id, progress="트렌드 분석 중...")
 
         # Phase 3: 트렌드 점수
         logger.info(f"[{job_id}] Phase 3: 트렌드 분석")
-        score = await calculate_trend_score(script_text, category)
-
-        JOBS[job_id]["progress"] = "AI 콘텐츠 생성 중..."
-
-        # Phase 4: 제목 + 썸네일 + 리포트 병렬 생성
-        logger.info(f"[{job_id}] Phase 4: AI 생성 (병렬)")
-        titles, thumbnails, report = await asyncio.gather(
-            generate_titles(script_text, category, custom_prompt),
-            generate_thumbnails(script_text, category, custom_prompt),
-            generate_report(script_text, score, category),
-        )
+        ctx      = build_analysis_context(script_text, category, frames, precomputed)
+        combined = await generate_single_shot(ctx, custom_prompt) if SINGLE_SHOT_MODE else None
+        score    = combined["score"] if combined else await calculate_trend_score(ctx)
+
+        # 점수는 Phase 4를 기다리지 않고 먼저 전달 (단일 호출 모드면 제목·리포트도 함께)
+        partial   = {"score": score}
+        artifacts = {"titles": "pending", "thumbnails": "pending", "report": "pending"}
+        if combined:
+            partial.update(titles=combined["titles"], report=combined["report"])
+            artifacts.update(titles="done", report="done")
+        await update_job(job_id, progress="AI 콘텐츠 생성 중...", partial=dict(partial), artifacts=dict(artifacts))
+
+        async def _artifact(name: str, coro):
+            """산출물 1개 완료 즉시 부분 결과로 기록"""
+            value           = await coro
+            partial[name]   = value
+            artifacts[name] = "done"
+            partial.pop(f"{name}_draft", None)
+            await update_job(job_id, partial=dict(partial), artifacts=dict(artifacts))
+            logger.info(f"[{job_id}]   {name} 완료")
+            return value
+
+        async def _on_thumbnail(thumb: dict):
+            partial["thumbnails"] = partial.get("thumbnails", []) + [thumb]
+            await update_job(job_id, partial=dict(partial))
+
+        last_draft_at = 0.0
+
+        async def _on_report_chunk(text: str):
+            # 토큰마다 저장소에 쓰지 않도록 REPORT_STREAM_INTERVAL_SEC 간격으로만 반영
+            nonlocal last_draft_at
+            now = time.monotonic()
+            if now - last_draft_at < REPORT_STREAM_INTERVAL_SEC:
+                return
+            last_draft_at           = now
+            partial["report_draft"] = text
+            artifacts["report"]     = "streaming"
+            await update_job(job_id, partial=dict(partial), artifacts=dict(artifacts))
+
+        if combined:
+            # Phase 4: 단일 호출로 받은 키워드로 썸네일만 생성
+            logger.info(f"[{job_id}] Phase 4: 썸네일 생성 (단일 호출 모드)")
+            titles, report = combined["titles"], combined["report"]
+            thumbnails     = await _artifact(
+                "thumbnails", generate_thumbnails(script_text, category, custom_prompt, _on_thumbnail, combined["keywords"])
+            )
+        else:
+            # Phase 4: 제목 + 썸네일 + 리포트 병렬 생성 (끝나는 순서대로 작업 레코드에 반영)
+            logger.info(f"[{job_id}] Phase 4: AI 생성 (병렬)")
+            titles, thumbnails, report = await asyncio.gather(
+                _artifact("titles",     generate_titles(script_text, category, custom_prompt, precomputed)),
+                _artifact("thumbnails", generate_thumbnails(script_text, category, custom_prompt, _on_thumbnail)),
+                _artifact("report",     generate_report(script_text, score, category, _on_report_chunk if REPORT_STREAMING else None)),
+            )
 
-        JOBS[job_id].update({
-            "status":   "completed",
-            "progress": "완료",
-            "result": {
-                "score":              score,
-                "titles":             titles,
-                "thumbnails":         thumbnails,
-                "report":             report,
-                "transcript_preview": script_text[:500],
-                "wpm":                transcript["wpm"],
-                "frame_count":        len(frame_paths),
-                "category":           category,
-                "analyzed_at":        datetime.now().isoformat(),
-            },
-        })
+        result = {
+            "score":              score,
+            "titles":             titles,
+            "thumbnails":         thumbnails,
+            "report":             report,
+            "transcript_preview": script_text[:500],
+            "wpm":                transcript["wpm"],
+            "speech_metrics":     transcript.get("speech_metrics", {}),
+            "frame_count":        frame_count,
+            "category":           category,
+            "analyzed_at":        datetime.now().isoformat(),
+        }
+        await update_job(job_id, status="completed", progress="완료", result=result, partial=None)
         logger.info(f"[{job_id}] 분석 완료!")
 
+        if content_hash:
+            key = result_cache.result_key(content_hash, category, custom_prompt, precomputed.get("generation", ""))
+            await run_io(result_cache.put_result, key, result)
+            await run_io(result_cache.prune)
+
     except Exception as e:
         logger.error(f"[{job_id}] 분석 실패: {e}")
-        JOBS[job_id]["status"] = "failed"
-        JOBS[job_id]["error"]  = str(e)
+        await update_job(job_id, status="failed", error=str(e))
 
     finally:
         # 혹시 남아있는 임시 파일 정리
@@ -661,12 +1909,99 @@ async def run_analysis_pipeline(job_id: str, video_path: str, category: str, cus
                     os.remove(path)
                 except Exception:
                     pass
-        # 오래된 작업 정리
-        cleanup_old_jobs()
 
 
 # ============================================================
-# 6. API 엔드포인트
+# 6. 작업 스케줄러 (동시 실행 상한 + FIFO 대기열)
+# ============================================================
+class SchedulerFullError(Exception):
+    """대기열이 가득 차 새 작업을 받을 수 없음"""
+
+
+class JobScheduler:
+    """
+    분석 파이프라인 실행기
+    - concurrency개의 워커 태스크가 FIFO 대기열에서 작업을 꺼내 실행
+    - 대기열이 max_queued를 넘으면 submit이 SchedulerFullError → API에서 429
+    - 최근 작업 소요시간 지수이동평균으로 대기 순번별 예상 대기시간(ETA) 산출
+    """
+
+    def __init__(self, concurrency: int, max_queued: int):
+        self.concurrency = max(1, concurrency)
+        self.max_queued  = max_queued
+        self.avg_job_sec = 60.0
+        self._queue      = None  # asyncio.Queue — 이벤트 루프 안(start)에서 생성
+        self._waiting    = deque()
+        self._running    = set()
+        self._workers    = []
+
+    def start(self):
+        self._queue   = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._worker(i)) for i in range(self.concurrency)]
+        logger.info(f"작업 스케줄러 시작 (동시 {self.concurrency}건, 대기열 {self.max_queued}건)")
+
+    async def stop(self) -> list[str]:
+        """워커 취소 후 끝내지 못한 작업 ID(실행 중 + 대기 중) 반환"""
+        unfinished = [*self._running, *self._waiting]
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        return unfinished
+
+    def is_full(self) -> bool:
+        return len(self._waiting) >= self.max_queued
+
+    def submit(self, job_id: str, func, *args) -> int:
+        """작업을 대기열에 추가하고 대기 순번(1부터) 반환"""
+        if self.is_full():
+            raise SchedulerFullError(job_id)
+        self._waiting.append(job_id)
+        self._queue.put_nowait((job_id, func, args))
+        return len(self._waiting)
+
+    def position(self, job_id: str) -> int | None:
+        """대기 순번 (1부터, 실행 중이거나 없는 작업은 None)"""
+        try:
+            return self._waiting.index(job_id) + 1
+        except ValueError:
+            return None
+
+    def eta_sec(self, position: int) -> int:
+        """대기 순번 기준 실행 시작까지 예상 시간 (초)"""
+        busy = len(self._running) >= self.concurrency
+        return int(math.ceil(position / self.concurrency) * self.avg_job_sec) if busy or position > 1 else 0
+
+    def stats(self) -> dict:
+        return {
+            "running":     len(self._running),
+            "queued":      len(self._waiting),
+            "concurrency": self.concurrency,
+            "max_queued":  self.max_queued,
+            "avg_job_sec": round(self.avg_job_sec, 1),
+        }
+
+    async def _worker(self, worker_id: int):
+        while True:
+            job_id, func, args = await self._queue.get()
+            self._waiting.remove(job_id)
+            self._running.add(job_id)
+            start = time.time()
+            try:
+                await func(job_id, *args)
+            except Exception as e:
+                logger.error(f"[{job_id}] 워커 {worker_id} 작업 오류: {e}")
+            finally:
+                self._running.discard(job_id)
+                self.avg_job_sec = 0.8 * self.avg_job_sec + 0.2 * (time.time() - start)
+                self._queue.task_done()
+
+
+scheduler = JobScheduler(MAX_CONCURRENT_JOBS, MAX_QUEUED_JOBS)
+
+
+# ============================================================
+# 7. API 엔드포인트
 # ============================================================
 
 @app.get("/api/health")
@@ -675,14 +2010,38 @@ async def health():
     return {
         "service": "Think:it Pro API",
         "status":  "running",
-        "precomputed": {
-            "tfidf_categories": len(PRECOMPUTED.get("tfidf", {})),
-            "youtube_data":     len(PRECOMPUTED.get("df", pd.DataFrame())),
-        },
-        "active_jobs": len(JOBS),
+        "precomputed": precomputed_summary(PRECOMPUTED),
+        "active_jobs": await run_store(job_store.count),
+        "scheduler":   scheduler.stats(),
     }
 
 
+def precomputed_summary(snapshot: dict) -> dict:
+    return {
+        "tfidf_categories": len(snapshot.get("index", ())),
+        "youtube_data":     sum(s.get("video_count", 0) for s in snapshot.get("stats", {}).values()),
+        "generation":       snapshot.get("generation"),
+        "loaded_at":        snapshot.get("loaded_at"),
+    }
+
+
+@app.post("/api/admin/reload")
+async def admin_reload(x_admin_token: str = Header("")):
+    """
+    사전계산 데이터 무중단 재로드 (X-Admin-Token 헤더 = ADMIN_TOKEN)
+    - 새 세대를 스레드에서 로드한 뒤 참조만 교체, 진행 중 작업은 기존 스냅샷으로 완료
+    - 요청을 받은 워커 프로세스 1개만 재로드됨 → 워커 여러 개(--workers N)로 띄운 경우 PRECOMPUTED_WATCH_SEC 사용
+    """
+    if not ADMIN_TOKEN or not hmac.compare_digest(x_admin_token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        return JSONResponse(status_code=403, content={"error": "관리자 토큰이 올바르지 않습니다"})
+    try:
+        snapshot = await reload_precomputed()
+    except Exception as e:
+        logger.error(f"사전계산 재로드 실패, 기존 스냅샷 유지: {e}")
+        return JSONResponse(status_code=500, content={"error": f"사전계산 데이터 로드 실패: {e}"})
+    return {"status": "reloaded", "load_sec": round(snapshot["load_sec"], 2), **precomputed_summary(snapshot)}
+
+
 @app.get("/api/categories")
 async def get_categories():
     """사용 가능한 카테고리 목록"""
@@ -690,51 +2049,218 @@ async def get_categories():
     return {"categories": available}
 
 
+class UploadTooLargeError(Exception):
+    """업로드 크기가 MAX_UPLOAD_MB 초과"""
+
+
+class UploadFormError(Exception):
+    """multipart 본문 형식 오류 / video 파트 누락"""
+
+
+async def receive_upload(request: Request, job_id: str) -> dict:
+    """
+    multipart 요청 본문을 request.stream()에서 바로 파싱 (Starlette 임시 스풀 파일을 거치지 않음)
+    - video 파트는 UPLOADS_DIR/{job_id}_{파일명}에 곧바로 기록 → 디스크 기록 1회
+    - 파서 콜백은 데이터를 모으기만 하고, UPLOAD_BLOCK_BYTES 단위 기록 + SHA-256 계산은 run_io로 넘김
+      (이벤트 루프에서 파일 쓰기/해시를 하지 않음)
+    - MAX_UPLOAD_MB 초과 시 즉시 중단하고 부분 파일 삭제
+    - 그 외 텍스트 필드는 FORM_FIELD_MAX_BYTES까지 메모리에 보관
+    반환: {"fields", "filename", "path", "size", "sha256"}
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise UploadFormError("multipart/form-data 요청이 아닙니다")
+
+    max_bytes = MAX_UPLOAD_MB * 1024 * 1024
+    upload    = {"fields": {}, "filename": None, "path": None, "size": 0, "sha256": None}
+    digest    = hashlib.sha256()
+    part      = {}
+    header    = [b"", b""]
+    sink      = {"file": None, "pending": bytearray(), "done": False}  # video 파트 기록 상태
+
+    def write_block(block: bytes, close: bool):
+        """IO_EXECUTOR에서 실행 — 첫 블록에서 파일을 열고, 해시 갱신 + 기록, 파트가 끝났으면 닫음"""
+        if sink["file"] is None:
+            sink["file"] = open(upload["path"], "wb")
+        digest.update(block)
+        sink["file"].write(block)
+        if close:
+            sink["file"].close()
+            sink["file"] = None
+
+    async def flush():
+        block = bytes(sink["pending"])
+        sink["pending"].clear()
+        await run_io(write_block, block, sink["done"])
+
+    def on_part_begin():
+        part.clear()
+        part.update(headers={}, buffer=bytearray(), video=False)
+
+    def on_header_field(data, start, end):
+        header[0] += data[start:end]
+
+    def on_header_value(data, start, end):
+        header[1] += data[start:end]
+
+    def on_header_end():
+        part["headers"][header[0].lower()] = header[1]
+        header[0] = header[1] = b""
+
+    def on_headers_finished():
+        _, disposition = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        part["name"] = disposition.get(b"name", b"").decode("utf-8", "replace")
+        if part["name"] == "video" and upload["path"] is None:
+            filename           = disposition.get(b"filename", b"video.mp4").decode("utf-8", "replace")
+            upload["filename"] = Path(filename).name or "video.mp4"
+            upload["path"]     = str(UPLOADS_DIR / f"{job_id}_{upload['filename']}")
+            part["video"]      = True
+
+    def on_part_data(data, start, end):
+        chunk = data[start:end]
+        if part["video"]:
+            upload["size"] += len(chunk)
+            if upload["size"] > max_bytes:
+                raise UploadTooLargeError(upload["size"])
+            sink["pending"] += chunk
+        else:
+            part["buffer"] += chunk
+            if len(part["buffer"]) > FORM_FIELD_MAX_BYTES:
+                raise UploadFormError(f"{part['name']} 필드가 너무 깁니다")
+
+    def on_part_end():
+        if part["video"]:
+            sink["done"] = True
+        else:
+            upload["fields"][part["name"]] = part["buffer"].decode("utf-8", "replace")
+
+    parser = MultipartParser(params[b"boundary"], {
+        "on_part_begin":       on_part_begin,
+        "on_header_field":     on_header_field,
+        "on_header_value":     on_header_value,
+        "on_header_end":       on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data":        on_part_data,
+        "on_part_end":         on_part_end,
+    })
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if len(sink["pending"]) >= UPLOAD_BLOCK_BYTES or (sink["done"] and upload["sha256"] is None):
+                await flush()
+                if sink["done"]:
+                    upload["sha256"] = digest.hexdigest()
+        parser.finalize()
+        if upload["path"] is None:
+            raise UploadFormError("video 파일이 없습니다")
+        if upload["sha256"] is None:
+            raise UploadFormError("video 파트가 끝나지 않았습니다")
+    except BaseException:
+        if sink["file"] is not None:
+            sink["file"].close()
+        if upload["path"] and os.path.exists(upload["path"]):
+            os.remove(upload["path"])
+        raise
+
+    return upload
+
+
+def _queue_full_response() -> JSONResponse:
+    """대기열 포화 — 429 + Retry-After(예상 대기시간)"""
+    retry_after = scheduler.eta_sec(scheduler.max_queued + 1)
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(retry_after)},
+        content={"error": "분석 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.", "eta_sec": retry_after},
+    )
+
+
 @app.post("/api/analyze")
-async def start_analysis(
-    background_tasks: BackgroundTasks,
-    video: UploadFile = File(...),
-    category: str    = Form("Entertainment"),
-    custom_prompt: str = Form(""),
-):
-    """영상 분석 시작 — 즉시 job_id 반환, 백그라운드 처리"""
-    job_id     = uuid.uuid4().hex[:12]
-    video_path = str(UPLOADS_DIR / f"{job_id}_{video.filename}")
-
-    content = await video.read()
-    with open(video_path, "wb") as f:
-        f.write(content)
-
-    file_size_mb = len(content) / (1024 * 1024)
-    logger.info(f"영상 접수: {video.filename} ({file_size_mb:.1f}MB), 카테고리: {category}")
-
-    JOBS[job_id] = {
-        "status":     "queued",
-        "progress":   "대기 중...",
-        "created_at": datetime.now().isoformat(),
-        "filename":   video.filename,
-        "category":   category,
-    }
+async def start_analysis(request: Request):
+    """
+    영상 분석 시작 — 즉시 job_id 반환, 스케줄러 대기열에서 순서대로 처리
+    multipart 필드: video (파일), category (기본 Entertainment), custom_prompt
+    - 대기열 포화(429)는 결과 캐시 조회 뒤에 판단 — 캐시로 즉시 끝나는 업로드는 대기열이 차 있어도 받음
+    """
+    # Content-Length만으로 한도 초과가 확실하면 본문을 받지 않고 거절
+    too_large = JSONResponse(
+        status_code=413,
+        content={"error": f"영상 파일은 최대 {MAX_UPLOAD_MB}MB까지 업로드할 수 있습니다.", "max_upload_mb": MAX_UPLOAD_MB},
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_UPLOAD_MB * 1024 * 1024 + FORM_FIELD_MAX_BYTES:
+        return too_large
 
-    background_tasks.add_task(run_analysis_pipeline, job_id, video_path, category, custom_prompt)
+    job_id = uuid.uuid4().hex[:12]
+    try:
+        upload = await receive_upload(request, job_id)
+    except UploadTooLargeError:
+        return too_large
+    except UploadFormError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+
+    category      = upload["fields"].get("category") or "Entertainment"
+    custom_prompt = upload["fields"].get("custom_prompt", "")
+    filename      = upload["filename"]
+    video_path    = upload["path"]
+    size_bytes    = upload["size"]
+    content_hash  = upload["sha256"]
+
+    file_size_mb = size_bytes / (1024 * 1024)
+    logger.info(f"영상 접수: {filename} ({file_size_mb:.1f}MB, sha256={content_hash[:12]}), 카테고리: {category}")
+
+    await run_store(job_store.create, job_id, {
+        "status":       "queued",
+        "progress":     "대기 중...",
+        "created_at":   datetime.now().isoformat(),
+        "filename":     filename,
+        "category":     category,
+        "size_bytes":   size_bytes,
+        "content_hash": content_hash,
+    })
+
+    # 같은 영상 + 카테고리 + 추가 요청의 결과 캐시 적중 시 대기열 없이 즉시 완료 (대기열 포화 여부와 무관)
+    if CACHE_ENABLED:
+        key    = result_cache.result_key(content_hash, category, custom_prompt, PRECOMPUTED.get("generation", ""))
+        cached = await run_io(result_cache.get_result, key)
+        if cached is not None:
+            os.remove(video_path)
+            await update_job(job_id, status="completed", progress="완료", result={**cached, "cached": True})
+            logger.info(f"[{job_id}] 결과 캐시 적중 — 분석 생략")
+            return {"job_id": job_id, "status": "completed", "message": "이전 분석 결과를 불러왔습니다."}
+
+    try:
+        position = scheduler.submit(job_id, run_analysis_pipeline, video_path, category, custom_prompt)
+    except SchedulerFullError:
+        # 대기열 포화 — 캐시로 처리할 수 없는 작업만 여기서 거절
+        await run_store(job_store.delete, job_id)
+        os.remove(video_path)
+        return _queue_full_response()
 
     return {
-        "job_id":  job_id,
-        "status":  "queued",
-        "message": "분석이 시작되었습니다.",
+        "job_id":         job_id,
+        "status":         "queued",
+        "message":        "분석이 시작되었습니다.",
+        "queue_position": position,
+        "eta_sec":        scheduler.eta_sec(position),
     }
 
 
-@app.get("/api/status/{job_id}")
-async def get_status(job_id: str):
-    """분석 작업 진행 상태 및 결과 조회"""
-    if job_id not in JOBS:
-        return JSONResponse(status_code=404, content={"error": "작업을 찾을 수 없습니다"})
-
-    job      = JOBS[job_id]
+def job_status_payload(job_id: str, job: dict) -> dict:
+    """작업 상태 응답 본문 (/api/status, /api/progress 공용)"""
     response = {"job_id": job_id, "status": job["status"], "progress": job.get("progress", "")}
 
-    if job["status"] == "completed":
+    if job["status"] == "queued":
+        position = scheduler.position(job_id)
+        if position is not None:
+            response["queue_position"] = position
+            response["eta_sec"]        = scheduler.eta_sec(position)
+    elif job["status"] == "processing":
+        # Phase 3 이후: 점수 → 제목/썸네일(장 단위)/리포트가 끝나는 대로 채워짐
+        if job.get("partial"):
+            response["partial"]   = job["partial"]
+            response["artifacts"] = job.get("artifacts", {})
+    elif job["status"] == "completed":
         response["result"] = job["result"]
     elif job["status"] == "failed":
         response["error"] = job.get("error", "알 수 없는 오류")
@@ -742,10 +2268,63 @@ async def get_status(job_id: str):
     return response
 
 
+async def progress_events(job_id: str, job: dict):
+    """
+    SSE 이벤트 생성기
+    - 같은 프로세스의 변경: progress_bus로 즉시 수신
+    - SSE_POLL_SEC 동안 이벤트가 없으면 저장소 재조회 (다른 워커가 처리 중인 작업 / 대기 순번 변화)
+      → version·대기 순번이 바뀐 경우에만 전송, 아니면 keep-alive 주석만 전송
+    """
+    queue = progress_bus.subscribe(job_id)
+    sent  = None
+    try:
+        while job is not None:
+            payload = job_status_payload(job_id, job)
+            marker  = (job.get("version", 0), payload.get("queue_position"))
+            if marker != sent:
+                sent = marker
+                yield f"event: progress\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+                if job["status"] in ("completed", "failed"):
+                    return
+            try:
+                job = await asyncio.wait_for(queue.get(), timeout=SSE_POLL_SEC)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                job = await run_store(job_store.get, job_id)
+    finally:
+        progress_bus.unsubscribe(job_id, queue)
+
+
+@app.get("/api/status/{job_id}")
+async def get_status(job_id: str):
+    """분석 작업 진행 상태 및 결과 조회"""
+    job = await run_store(job_store.get, job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "작업을 찾을 수 없습니다"})
+    return job_status_payload(job_id, job)
+
+
+@app.get("/api/progress/{job_id}")
+async def stream_progress(job_id: str):
+    """
+    작업 진행 상태 SSE 스트림 (event: progress, data: /api/status와 같은 형식)
+    - 단계 전환/부분 결과를 발생 즉시 전달, 완료·실패 이벤트 후 스트림 종료
+    """
+    job = await run_store(job_store.get, job_id)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "작업을 찾을 수 없습니다"})
+    return StreamingResponse(
+        progress_events(job_id, job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/api/send-report")
 async def send_report(job_id: str = Form(...), email: str = Form(...)):
     """분석 결과를 이메일로 발송"""
-    if job_id not in JOBS or JOBS[job_id]["status"] != "completed":
+    job = await run_store(job_store.get, job_id)
+    if job is None or job["status"] != "completed":
         return JSONResponse(status_code=400, content={"error": "완료된 분석 결과가 없습니다"})
 
     sender   = os.getenv("EMAIL_SENDER", "")
@@ -754,7 +2333,7 @@ async def send_report(job_id: str = Form(...), email: str = Form(...)):
         return {"status": "error", "message": "이메일 설정이 되어있지 않습니다"}
 
     try:
-        result = JOBS[job_id]["result"]
+        result = job["result"]
         msg    = MIMEMultipart()
         msg["From"]    = sender
         msg["To"]      = email
@@ -780,14 +2359,14 @@ async def send_report(job_id: str = Form(...), email: str = Form(...)):
 
 
 # ============================================================
-# 7. 프론트엔드 정적 파일 서빙
+# 8. 프론트엔드 정적 파일 서빙
 # 반드시 모든 API 라우트 정의 이후 마지막에 위치
 # ============================================================
 app.mount("/", StaticFiles(directory=str(PROJECT_ROOT / "frontend"), html=True), name="frontend")
 
 
 # ============================================================
-# 8. 서버 직접 실행 시
+# 9. 서버 직접 실행 시
 # ============================================================
 if __name__ == "__main__":
     import uvicorn
@@ -5,22 +5,35 @@ YouTube 데이터 수집 + TF-IDF 사전 계산 스크립트
 또는: python app/precompute.py
 
 수행 작업:
-1. YouTube Data API v3로 한국 인기 영상 카테고리별 50개씩 수집
-2. data/youtube_top200_data.csv 저장
-3. 카테고리별 TF-IDF 벡터 → data/precomputed/tfidf_{category}.npy + vectorizer_{category}.pkl
-4. 카테고리별 통계치 → data/precomputed/category_stats.json
+1. YouTube Data API v3로 한국 인기 영상 카테고리별 50개씩 수집 (카테고리 동시 수집, 공유 세션 + 속도 제한)
+2. 일자별 컬럼형 스냅샷 → data/snapshots/YYYY-MM-DD.parquet (SNAPSHOT_RETENTION_DAYS일 보관)
+3. 전 카테고리 어휘·IDF·TF-IDF CSR 행렬 → data/precomputed/category_index.bin (단일 버전 인덱스)
+4. 카테고리별 통계치 + 태그 Coverage 통계 → data/precomputed/category_stats.json
 5. 인기 제목 패턴 → data/precomputed/top_titles.json
+6. 카테고리별 콘텐츠 해시 → data/precomputed/manifest.json
+   (3~5는 카테고리 단위로 프로세스 풀에서 병렬 빌드, 모든 파일은 임시 파일 + rename으로 교체)
+
+--incremental: 직전 스냅샷에 video_id 기준으로 변경분만 반영하고,
+               manifest 해시가 바뀐 카테고리만 TF-IDF/통계를 재계산 (나머지는 기존 결과 재사용)
 """
 
 import os
 import json
-import pickle
+import random
+import argparse
+import hashlib
+import struct
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from sklearn.feature_extraction.text import TfidfVectorizer
 from dotenv import load_dotenv
@@ -35,10 +48,13 @@ logger = logging.getLogger("precompute")
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 PRECOMPUTED_DIR = DATA_DIR / "precomputed"
-CSV_PATH = DATA_DIR / "youtube_top200_data.csv"
+SNAPSHOT_DIR = DATA_DIR / "snapshots"  # 일자별 수집 스냅샷 (Parquet) — 트렌드 추적용 이력
+SNAPSHOT_RETENTION_DAYS = int(os.getenv("SNAPSHOT_RETENTION_DAYS", "30"))
+MANIFEST_PATH = PRECOMPUTED_DIR / "manifest.json"  # 카테고리별 콘텐츠 해시 (--incremental 비교 기준)
 
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 PRECOMPUTED_DIR.mkdir(parents=True, exist_ok=True)
+SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
 
 load_dotenv(PROJECT_ROOT / ".env")
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
@@ -65,21 +81,126 @@ CATEGORIES = {
 
 MAX_PER_CATEGORY = 50  # 카테고리당 최대 수집 영상 수
 REGION_CODE = "KR"     # 한국 인기 영상 기준
-YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_API_BASE = os.getenv("YOUTUBE_API_BASE", "https://www.googleapis.com/youtube/v3")  # 로컬 스텁 테스트 시 교체
+
+# 동시 수집 — 카테고리 단위 워커 수, 전체 요청 속도 상한(토큰 버킷), 429/5xx 재시도
+COLLECT_WORKERS = int(os.getenv("COLLECT_WORKERS", "8"))
+API_RATE_PER_SEC = float(os.getenv("YOUTUBE_API_RATE", "10"))
+API_BURST = 10
+API_MAX_RETRIES = 4
+API_BACKOFF_SEC = 0.5
+
+# 카테고리별 산출물 빌드 — 프로세스 풀 워커 수 (기본: 코어 수)
+BUILD_WORKERS = int(os.getenv("BUILD_WORKERS", str(os.cpu_count() or 1)))
+
+# 단일 카테고리 인덱스 파일 포맷
+# [magic 8B][version u32][reserved u32][header_len u64][header JSON][padding][배열 블록 ...]
+# 각 배열은 ALIGN 바이트 경계에 raw little-endian으로 기록 → 서버에서 np.memmap 1회로 전부 참조
+INDEX_PATH = PRECOMPUTED_DIR / "category_index.bin"
+INDEX_MAGIC = b"THINKIDX"
+INDEX_VERSION = 2
+INDEX_ALIGN = 64
+
+# category_stats.json에서 전체 데이터 기준 태그 통계를 담는 예약 키 (카테고리 목록에서 제외)
+ALL_CATEGORIES_KEY = "_all"
+TOP_TAGS_LIMIT = 20
+
+TFIDF_PARAMS = {
+    "max_features": 500,
+    "ngram_range":  (1, 2),
+}
 
 
 # ============================================================
 # 1. YouTube Data API v3 수집
 # ============================================================
-def fetch_popular_videos(category_id: str, category_name: str, max_results: int = 50) -> list[dict]:
+class TokenBucket:
+    """
+    스레드 간 공유 요청 속도 제한 — 초당 rate개 토큰 충전, 최대 burst개 적립
+    고정 sleep 대신 토큰이 모자랄 때만 필요한 만큼 대기
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def create_session() -> requests.Session:
+    """keep-alive 연결을 워커 수만큼 재사용하는 공유 세션"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(COLLECT_WORKERS, 1))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _retry_delay(resp, attempt: int) -> float:
+    """Retry-After(초) 우선, 없으면 지수 백오프 × jitter(0.5~1.5)"""
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return API_BACKOFF_SEC * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def api_get(session: requests.Session, limiter: TokenBucket, path: str, params: dict) -> dict:
+    """
+    YouTube API GET — 토큰 버킷 통과 후 요청, 429/5xx/연결 오류는 API_MAX_RETRIES회까지 재시도
+    그 외 4xx는 즉시 예외
+    """
+    for attempt in range(API_MAX_RETRIES + 1):
+        limiter.acquire()
+        resp = None
+        try:
+            resp = session.get(f"{YOUTUBE_API_BASE}/{path}", params=params, timeout=10)
+            if resp.status_code != 429 and resp.status_code < 500:
+                resp.raise_for_status()
+                return resp.json()
+            error = requests.HTTPError(f"{resp.status_code} {resp.reason}", response=resp)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+        if attempt == API_MAX_RETRIES:
+            raise error
+        delay = _retry_delay(resp, attempt)
+        logger.warning(f"  API 재시도 {attempt + 1}/{API_MAX_RETRIES} ({delay:.1f}초 후): {error}")
+        time.sleep(delay)
+
+
+def fetch_popular_videos(
+    category_id: str,
+    category_name: str,
+    max_results: int = 50,
+    session: requests.Session | None = None,
+    limiter: TokenBucket | None = None,
+) -> list[dict] | None:
     """
     YouTube mostPopular 차트에서 카테고리별 인기 영상 수집
     한 페이지당 최대 50개, 필요 시 pageToken으로 이어서 수집
+    session/limiter는 collect_all_categories에서 전 카테고리가 공유
+    API 오류(재시도 소진)면 None — 차트가 실제로 비어 있는 경우([])와 구분
     """
     if not YOUTUBE_API_KEY or YOUTUBE_API_KEY == "여기에키입력":
         logger.warning("YOUTUBE_API_KEY 미설정 — 더미 데이터 반환")
         return _dummy_videos(category_name, max_results)
 
+    logger.info(f"수집 중: {category_name} (ID: {category_id})")
+    session = session or create_session()
+    limiter = limiter or TokenBucket(API_RATE_PER_SEC, API_BURST)
+
     videos = []
     page_token = None
 
@@ -96,12 +217,10 @@ def fetch_popular_videos(category_id: str, category_name: str, max_results: int
             params["pageToken"] = page_token
 
         try:
-            resp = requests.get(f"{YOUTUBE_API_BASE}/videos", params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            data = api_get(session, limiter, "videos", params)
         except requests.RequestException as e:
             logger.error(f"API 요청 실패 ({category_name}): {e}")
-            break
+            return None  # 일부 페이지만 받은 결과로 카테고리를 바꾸지 않음
 
         items = data.get("items", [])
         if not items:
@@ -132,8 +251,6 @@ def fetch_popular_videos(category_id: str, category_name: str, max_results: int
         if not page_token:
             break
 
-        time.sleep(0.1)  # API 레이트 리밋 방지
-
     logger.info(f"  [{category_name}] {len(videos)}개 수집 완료")
     return videos
 
@@ -161,122 +278,474 @@ def _dummy_videos(category_name: str, count: int) -> list[dict]:
 
 
 # ============================================================
-# 2. 전체 카테고리 수집 → CSV 저장
+# 2. 전체 카테고리 수집 → 스냅샷 저장
 # ============================================================
-def collect_all_categories() -> pd.DataFrame:
-    """모든 카테고리 수집 후 DataFrame 반환"""
+def collect_all_categories(fallback: pd.DataFrame | None = None) -> pd.DataFrame:
+    """
+    모든 카테고리를 COLLECT_WORKERS개 스레드로 동시 수집 후 DataFrame 반환
+    - keep-alive 세션 1개 + 토큰 버킷 1개를 전 카테고리가 공유 (전체 요청 속도 상한 유지)
+    - 결과는 CATEGORIES 순서로 합침 (실행마다 스냅샷 행 순서 동일)
+    - 수집에 실패한 카테고리는 fallback(직전 스냅샷)의 행을 그대로 이어 씀
+      → 콘텐츠 해시가 같으므로 산출물도 재사용되고, 일시적 오류로 카테고리가 서비스에서 사라지지 않음
+    """
     logger.info("=" * 60)
-    logger.info(f"YouTube 인기 영상 수집 시작 (지역: {REGION_CODE})")
+    logger.info(f"YouTube 인기 영상 수집 시작 (지역: {REGION_CODE}, 동시 {COLLECT_WORKERS}개)")
     logger.info("=" * 60)
 
-    all_videos = []
-    for cat_id, cat_name in CATEGORIES.items():
-        logger.info(f"수집 중: {cat_name} (ID: {cat_id})")
-        videos = fetch_popular_videos(cat_id, cat_name, MAX_PER_CATEGORY)
-        all_videos.extend(videos)
-        time.sleep(0.2)  # 카테고리 간 딜레이
+    session = create_session()
+    limiter = TokenBucket(API_RATE_PER_SEC, API_BURST)
+    with session, ThreadPoolExecutor(max_workers=COLLECT_WORKERS) as pool:
+        futures = [
+            pool.submit(fetch_popular_videos, cat_id, cat_name, MAX_PER_CATEGORY, session, limiter)
+            for cat_id, cat_name in CATEGORIES.items()
+        ]
+        results = [future.result() for future in futures]
+
+    frames = []
+    for cat_name, videos in zip(CATEGORIES.values(), results):
+        if videos is not None:
+            frames.append(pd.DataFrame(videos))
+            continue
+        kept = fallback[fallback["category_name"] == cat_name] if fallback is not None else None
+        if kept is None or kept.empty:
+            logger.warning(f"  [{cat_name}] 수집 실패 — 직전 스냅샷에도 없어 이번 결과에서 제외")
+            continue
+        logger.warning(f"  [{cat_name}] 수집 실패 — 직전 스냅샷 {len(kept)}개 영상 유지")
+        frames.append(kept)
+
+    df = pd.concat([f for f in frames if not f.empty], ignore_index=True) if frames else pd.DataFrame()
+    logger.info(f"\n총 {len(df)}개 영상 수집")
+    return df
+
+
+# 스냅샷 스키마 — 카테고리는 dictionary(categorical), 태그는 list<string> (Parquet 사전 인코딩)
+SNAPSHOT_SCHEMA = pa.schema([
+    ("video_id",      pa.string()),
+    ("title",         pa.string()),
+    ("description",   pa.string()),
+    ("channel_title", pa.string()),
+    ("category_id",   pa.dictionary(pa.int8(), pa.string())),
+    ("category_name", pa.dictionary(pa.int8(), pa.string())),
+    ("tags",          pa.list_(pa.string())),
+    ("published_at",  pa.timestamp("ms", tz="UTC")),
+    ("view_count",    pa.int64()),
+    ("like_count",    pa.int64()),
+    ("comment_count", pa.int64()),
+    ("duration",      pa.string()),
+    ("thumbnail_url", pa.string()),
+])
+
+
+def save_snapshot(df: pd.DataFrame):
+    """
+    수집 결과 → 오늘 날짜 Parquet 스냅샷 (같은 날 재실행 시 덮어씀) + 보관 기간 지난 스냅샷 삭제
+    - 메모리 상의 tags는 기존과 같은 "|" 연결 문자열, 파일에서만 리스트로 저장
+    """
+    frame = df.assign(
+        category_id=df["category_id"].astype(str).astype("category"),
+        category_name=df["category_name"].astype("category"),
+        tags=df["tags"].fillna("").map(lambda tags: tags.split("|") if tags else []),
+        published_at=pd.to_datetime(df["published_at"], utc=True),
+    )
+    table = pa.Table.from_pandas(frame[SNAPSHOT_SCHEMA.names], schema=SNAPSHOT_SCHEMA, preserve_index=False)
+
+    path = SNAPSHOT_DIR / f"{time.strftime('%Y-%m-%d')}.parquet"
+    with atomic_open(path, "wb") as f:
+        pq.write_table(table, f, compression="zstd")
+    logger.info(f"스냅샷 {len(df)}개 영상 → {path}")
+
+    cutoff = time.strftime("%Y-%m-%d", time.localtime(time.time() - SNAPSHOT_RETENTION_DAYS * 86400))
+    for old in list_snapshots():
+        if old.stem < cutoff and old != path:
+            old.unlink()
+            logger.info(f"  보관 기간 지난 스냅샷 삭제: {old.name}")
+
 
-    df = pd.DataFrame(all_videos)
-    df.to_csv(CSV_PATH, index=False, encoding="utf-8-sig")
-    logger.info(f"\n총 {len(df)}개 영상 → {CSV_PATH}")
+def list_snapshots() -> list[Path]:
+    """일자별 스냅샷 경로 (오래된 순)"""
+    return sorted(SNAPSHOT_DIR.glob("????-??-??.parquet"))
+
+
+def load_snapshot(columns: list | None = None, path: Path | None = None) -> pd.DataFrame | None:
+    """
+    스냅샷 로드 (기본: 가장 최근 스냅샷, 없으면 None)
+    - columns: 필요한 컬럼만 읽음 (설명·썸네일 URL 등 큰 문자열 컬럼은 건너뜀)
+    - 카테고리는 문자열로, tags는 "|" 연결 문자열로, published_at은 API와 같은 ISO 문자열("...Z", 없으면 "")로
+      되돌려 수집 직후 DataFrame과 같은 형태로 반환
+    """
+    if path is None:
+        snapshots = list_snapshots()
+        if not snapshots:
+            return None
+        path = snapshots[-1]
+
+    df = pd.read_parquet(path, columns=columns)
+    for column in ("category_id", "category_name"):
+        if column in df:
+            df[column] = df[column].astype(str)
+    if "tags" in df:
+        df["tags"] = df["tags"].map("|".join)
+    if "published_at" in df:
+        df["published_at"] = df["published_at"].dt.strftime("%Y-%m-%dT%H:%M:%SZ").fillna("")
     return df
 
 
 # ============================================================
-# 3. TF-IDF 사전 계산
+# 2-1. 증분 갱신 — video_id 기준 diff + 카테고리 콘텐츠 해시
 # ============================================================
-def compute_tfidf(df: pd.DataFrame):
-    """카테고리별 TF-IDF 벡터 계산 후 저장"""
-    logger.info("\nTF-IDF 사전 계산 중...")
+def merge_snapshot(previous: pd.DataFrame, fetched: pd.DataFrame) -> pd.DataFrame:
+    """
+    새 수집 결과를 직전 스냅샷에 video_id 기준으로 반영
+    - 차트에 남은 영상: 직전 행 위치를 유지한 채 조회수/좋아요 등 값만 갱신
+    - 차트에서 빠진 영상은 제거, 새로 진입한 영상은 카테고리 뒤에 추가
+    """
+    key = ["category_name", "video_id"]
+    fetched = fetched.drop_duplicates(key)
+    kept = previous.merge(fetched[key], on=key)[key]
+    kept = kept.merge(fetched, on=key, how="left")
+    added = fetched.merge(previous[key], on=key, how="left", indicator=True)
+    added = added[added["_merge"] == "left_only"].drop(columns="_merge")
 
-    # 제목 + 태그를 합쳐서 텍스트 피처 생성
-    df["text_feature"] = df["title"] + " " + df["tags"].fillna("").str.replace("|", " ")
+    for category in fetched["category_name"].unique():
+        prev_ids = set(previous.loc[previous["category_name"] == category, "video_id"])
+        new_ids = set(fetched.loc[fetched["category_name"] == category, "video_id"])
+        logger.info(f"  [{category}] 유지 {len(prev_ids & new_ids)} / 신규 {len(new_ids - prev_ids)} / 이탈 {len(prev_ids - new_ids)}")
 
-    for category in df["category_name"].unique():
-        cat_df = df[df["category_name"] == category].copy()
-        texts = cat_df["text_feature"].fillna("").tolist()
+    merged = pd.concat([kept, added], ignore_index=True)[fetched.columns]
+    order = {name: i for i, name in enumerate(fetched["category_name"].unique())}
+    return merged.sort_values("category_name", key=lambda c: c.map(order), kind="stable").reset_index(drop=True)
 
-        if len(texts) < 2:
-            logger.warning(f"  [{category}] 영상 수 부족 ({len(texts)}개) — 스킵")
-            continue
 
-        vectorizer = TfidfVectorizer(max_features=500, ngram_range=(1, 2))
-        tfidf_matrix = vectorizer.fit_transform(texts)
+def _hash_rows(df: pd.DataFrame, columns: list) -> str:
+    rows = df[columns].fillna("").astype(str).sort_values("video_id")
+    return hashlib.sha256(rows.to_csv(index=False).encode("utf-8")).hexdigest()[:16]
 
-        # .npy 저장
-        npy_path = PRECOMPUTED_DIR / f"tfidf_{category}.npy"
-        np.save(npy_path, tfidf_matrix.toarray())
 
-        # vectorizer pickle 저장
-        pkl_path = PRECOMPUTED_DIR / f"vectorizer_{category}.pkl"
-        with open(pkl_path, "wb") as f:
-            pickle.dump(vectorizer, f)
+def category_hashes(df: pd.DataFrame) -> dict:
+    """
+    카테고리별 콘텐츠 해시
+    - text_hash: 구성 영상 + 제목/태그 → TF-IDF 재학습 필요 여부
+    - count_hash: 구성 영상 + 조회수/좋아요 → 통계/인기 제목 재계산 필요 여부
+    """
+    return {
+        category: {
+            "text_hash": _hash_rows(cat_df, ["video_id", "title", "tags"]),
+            "count_hash": _hash_rows(cat_df, ["video_id", "view_count", "like_count"]),
+            "video_count": len(cat_df),
+        }
+        for category, cat_df in df.groupby("category_name", sort=False)
+    }
 
-        logger.info(f"  [{category}] TF-IDF {tfidf_matrix.shape} → 저장 완료")
+
+def load_manifest() -> dict:
+    if not MANIFEST_PATH.exists():
+        return {}
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+        return json.load(f).get("categories", {})
+
+
+def save_manifest(hashes: dict):
+    """카테고리 해시가 그대로면 기록하지 않음 (서버 파일 감시가 새 세대로 오인하지 않도록)"""
+    if MANIFEST_PATH.exists() and load_manifest() == hashes:
+        return
+    manifest = {"updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "categories": hashes}
+    with atomic_open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
 
 
 # ============================================================
-# 4. 카테고리 통계 계산
+# 3. 카테고리별 산출물 빌드 — groupby 1회 + 프로세스 풀
 # ============================================================
-def compute_stats(df: pd.DataFrame):
-    """카테고리별 조회수/좋아요 통계 저장"""
-    logger.info("\n카테고리 통계 계산 중...")
-
-    stats = {}
-    for category in df["category_name"].unique():
-        cat_df = df[df["category_name"] == category]
-        stats[category] = {
-            "avg_views": int(cat_df["view_count"].mean()),
-            "median_views": int(cat_df["view_count"].median()),
-            "std_views": int(cat_df["view_count"].std()),
-            "avg_likes": int(cat_df["like_count"].mean()),
-            "video_count": len(cat_df),
+def build_artifacts(df: pd.DataFrame, text_only: set | None = None, count_only: set | None = None):
+    """
+    TF-IDF 인덱스 / 카테고리 통계 / 인기 제목을 한 단계에서 빌드
+    - DataFrame을 카테고리별로 한 번만 분할하고, 카테고리 단위 작업을 프로세스 풀에 분배 (BUILD_WORKERS = 코어 수)
+    - text_only / count_only: 재계산할 카테고리 (None이면 전체) — 나머지는 기존 산출물 재사용
+    - 모든 결과 파일은 임시 파일 + os.replace로 교체 → 서버가 반쯤 쓰인 파일을 읽는 일이 없음
+    """
+    logger.info(f"\n카테고리별 산출물 빌드 중... (워커 {BUILD_WORKERS}개)")
+
+    stats_path = PRECOMPUTED_DIR / "category_stats.json"
+    titles_path = PRECOMPUTED_DIR / "top_titles.json"
+    groups = {category: cat_df for category, cat_df in df.groupby("category_name", sort=False)}
+
+    prev_index = read_category_index(INDEX_PATH) if text_only is not None and INDEX_PATH.exists() else {}
+    prev_stats = _load_json(stats_path) if count_only is not None else {}
+    prev_titles = _load_json(titles_path) if count_only is not None else {}
+
+    tasks = {}
+    for category in groups:
+        fit_text = text_only is None or category in text_only or category not in prev_index
+        fit_counts = (count_only is None or category in count_only
+                      or category not in prev_stats or category not in prev_titles)
+        if fit_text or fit_counts:
+            tasks[category] = (fit_text, fit_counts)
+
+    built = {}
+    if tasks:
+        with ProcessPoolExecutor(max_workers=min(BUILD_WORKERS, len(tasks))) as pool:
+            results = pool.map(
+                build_category,
+                [groups[category] for category in tasks],
+                [fit_text for fit_text, _ in tasks.values()],
+                [fit_counts for _, fit_counts in tasks.values()],
+            )
+            built = dict(zip(tasks, results))
+
+    index, stats, top_titles = {}, {}, {}
+    for category, cat_df in groups.items():
+        result = {
+            "tfidf": prev_index.get(category),
+            "stats": prev_stats.get(category),
+            "top_titles": prev_titles.get(category),
+            **built.get(category, {}),
         }
+        if category not in built or not tasks[category][0]:
+            logger.info(f"  [{category}] 텍스트 변경 없음 — 기존 인덱스 재사용")
+        elif result["tfidf"] is None:
+            logger.warning(f"  [{category}] 영상 수 부족 ({len(cat_df)}개) — 스킵")
+        else:
+            logger.info(f"  [{category}] TF-IDF {tuple(result['tfidf']['shape'])} (nnz={result['tfidf']['nnz']})")
+
+        if result["tfidf"] is not None:
+            index[category] = result["tfidf"]
+        stats[category] = result["stats"]
+        top_titles[category] = result["top_titles"]
+    stats[ALL_CATEGORIES_KEY] = compute_tag_stats(df)
+
+    # 재학습한 카테고리도, 추가/제거된 카테고리도 없으면 인덱스 파일은 그대로 둠
+    if text_only is None or any(fit_text for fit_text, _ in tasks.values()) or set(index) != set(prev_index):
+        write_category_index(index, INDEX_PATH)
+        logger.info(f"  {len(index)}개 카테고리 인덱스 → {INDEX_PATH}")
+
+    if write_json_if_changed(stats_path, stats):
+        logger.info(f"  {len(stats) - 1}개 카테고리 통계 → {stats_path}")
+    if write_json_if_changed(titles_path, top_titles):
+        logger.info(f"  {len(top_titles)}개 카테고리 제목 패턴 → {titles_path}")
+
+
+def build_category(cat_df: pd.DataFrame, fit_text: bool, fit_counts: bool) -> dict:
+    """프로세스 풀 작업 단위 — 카테고리 하나의 산출물 중 요청된 것만 계산"""
+    result = {}
+    if fit_text:
+        result["tfidf"] = fit_category_tfidf(cat_df)
+    if fit_counts:
+        result["stats"] = category_stats(cat_df)
+        result["top_titles"] = category_top_titles(cat_df)
+    return result
+
+
+def fit_category_tfidf(cat_df: pd.DataFrame) -> dict | None:
+    """
+    카테고리 TF-IDF 학습 → 인덱스 파일에 그대로 기록할 배열 묶음 ({arrays, shape, nnz})
+    - 어휘(열 순서), IDF 벡터, CSR 행렬(data/indices/indptr), 행 평균(centroid)
+    - sklearn 객체를 pickle하지 않으므로 서버의 sklearn 버전과 무관
+    """
+    # 제목 + 태그를 합쳐서 텍스트 피처 생성
+    texts = (cat_df["title"] + " " + cat_df["tags"].fillna("").str.replace("|", " ")).fillna("").tolist()
+    if len(texts) < 2:
+        return None
+
+    vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+    matrix = vectorizer.fit_transform(texts).tocsr()
+    matrix.sort_indices()
+
+    terms = vectorizer.get_feature_names_out().tolist()
+    return {
+        "arrays": {
+            "terms":   np.frombuffer("\n".join(terms).encode("utf-8"), dtype=np.uint8),
+            "idf":     np.asarray(vectorizer.idf_, dtype="<f8"),
+            "data":    matrix.data.astype("<f4"),
+            "indices": matrix.indices.astype("<i4"),
+            "indptr":  matrix.indptr.astype("<i4"),
+            # L2 정규화된 행의 평균 → 서버는 질의 벡터와 내적 1회로 평균 코사인 유사도 계산
+            "centroid": np.asarray(matrix.mean(axis=0), dtype="<f8").ravel(),
+        },
+        "shape": list(matrix.shape),
+        "nnz":   int(matrix.nnz),
+    }
+
+
+def category_stats(cat_df: pd.DataFrame) -> dict:
+    """
+    카테고리 조회수/좋아요 통계 + 태그 Coverage 통계
+    - 서버의 Coverage 지표가 요청마다 태그를 explode하지 않도록 미리 계산
+    """
+    return {
+        "avg_views": int(cat_df["view_count"].mean()),
+        "median_views": int(cat_df["view_count"].median()),
+        "std_views": int(cat_df["view_count"].std()),
+        "avg_likes": int(cat_df["like_count"].mean()),
+        "video_count": len(cat_df),
+        **compute_tag_stats(cat_df),
+    }
+
 
-    out_path = PRECOMPUTED_DIR / "category_stats.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+def compute_tag_stats(df: pd.DataFrame) -> dict:
+    """태그 Coverage(고유 태그 / 전체 태그) 및 상위 태그 빈도표"""
+    all_tags = df["tags"].fillna("").str.split("|").explode()
+    all_tags = all_tags[all_tags != ""]
+    unique_tags = int(all_tags.nunique())
+    total_tags  = int(len(all_tags))
+    top_tags    = all_tags.value_counts().head(TOP_TAGS_LIMIT)
 
-    logger.info(f"  {len(stats)}개 카테고리 통계 → {out_path}")
+    return {
+        "tag_coverage": round(unique_tags / max(total_tags, 1) * 100, 1),
+        "unique_tags":  unique_tags,
+        "total_tags":   total_tags,
+        "top_tags":     {tag: int(count) for tag, count in top_tags.items()},
+    }
+
+
+def category_top_titles(cat_df: pd.DataFrame) -> list:
+    """조회수 기준 상위 20개 제목 — GPT 프롬프트에서 '인기 제목 패턴' 참고 데이터로 활용"""
+    return cat_df.nlargest(20, "view_count")["title"].tolist()
 
 
 # ============================================================
-# 5. 인기 제목 패턴 추출
+# 4. 단일 카테고리 인덱스 파일 읽기/쓰기
 # ============================================================
-def compute_top_titles(df: pd.DataFrame):
+def write_category_index(entries: dict, path: Path):
+    """
+    카테고리별 {arrays, shape, nnz}를 단일 인덱스 파일로 직렬화
+    - terms는 열 순서대로 "\n" 연결한 UTF-8 바이트 (토큰에 개행 없음)
+    - header JSON에 배열별 offset/length/dtype 기록
+    """
+    blobs  = []
+    header = {
+        "version":    INDEX_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {
+            "ngram_range":   list(TFIDF_PARAMS["ngram_range"]),
+            "lowercase":     True,
+            "token_pattern": r"(?u)\b\w\w+\b",
+            "norm":          "l2",
+        },
+        "categories": {},
+    }
+
+    offset = 0
+    for category, entry in entries.items():
+        layout = {}
+        for name, arr in entry["arrays"].items():
+            offset = _align(offset)
+            layout[name] = {"offset": offset, "length": int(arr.size), "dtype": arr.dtype.str}
+            blobs.append((offset, arr))
+            offset += arr.nbytes
+
+        header["categories"][category] = {
+            "shape":  entry["shape"],
+            "nnz":    entry["nnz"],
+            "arrays": layout,
+        }
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    prefix_len   = len(INDEX_MAGIC) + struct.calcsize("<IIQ") + len(header_bytes)
+    data_start   = _align(prefix_len)
+
+    with atomic_open(path, "wb") as f:
+        f.write(INDEX_MAGIC)
+        f.write(struct.pack("<IIQ", INDEX_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * (data_start - prefix_len))
+        for blob_offset, arr in blobs:
+            f.seek(data_start + blob_offset)
+            f.write(arr.tobytes())
+
+
+def read_category_index(path: Path) -> dict:
     """
-    카테고리별 상위 조회수 영상 제목 수집 → top_titles.json
-    GPT 프롬프트에서 '인기 제목 패턴' 참고 데이터로 활용
+    기존 인덱스 파일의 카테고리별 원시 배열 로드 ({arrays, shape, nnz})
+    - 버전/매직이 다르면 빈 dict → 전체 재학습
     """
-    logger.info("\n인기 제목 패턴 추출 중...")
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+        return {}
+    version, _, header_len = struct.unpack_from("<IIQ", raw, len(INDEX_MAGIC))
+    if version != INDEX_VERSION:
+        return {}
+    header_start = len(INDEX_MAGIC) + struct.calcsize("<IIQ")
+    header = json.loads(raw[header_start:header_start + header_len])
+    data_start = _align(header_start + header_len)
+
+    entries = {}
+    for category, meta in header["categories"].items():
+        arrays = {
+            name: np.frombuffer(raw, dtype=spec["dtype"], count=spec["length"], offset=data_start + spec["offset"])
+            for name, spec in meta["arrays"].items()
+        }
+        entries[category] = {"arrays": arrays, "shape": meta["shape"], "nnz": meta["nnz"]}
+    return entries
 
-    top_titles = {}
-    for category in df["category_name"].unique():
-        cat_df = df[df["category_name"] == category].copy()
-        # 조회수 기준 상위 20개 제목
-        top = cat_df.nlargest(20, "view_count")["title"].tolist()
-        top_titles[category] = top
 
-    out_path = PRECOMPUTED_DIR / "top_titles.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(top_titles, f, ensure_ascii=False, indent=2)
+def _align(n: int) -> int:
+    return (n + INDEX_ALIGN - 1) // INDEX_ALIGN * INDEX_ALIGN
 
-    logger.info(f"  {len(top_titles)}개 카테고리 제목 패턴 → {out_path}")
+
+# ============================================================
+# 5. 원자적 파일 교체
+# ============================================================
+@contextmanager
+def atomic_open(path: Path, mode: str = "w", **kwargs):
+    """
+    같은 디렉터리의 임시 파일에 기록한 뒤 os.replace로 교체
+    - 읽는 쪽은 항상 이전 파일 또는 완성된 새 파일만 보게 됨 (실패 시 임시 파일만 삭제)
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_json_if_changed(path: Path, data) -> bool:
+    """내용이 기존 파일과 같으면 건드리지 않음 (mtime 유지 → 서버 재로드/세대 변경 없음), 기록했으면 True"""
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return True
+
+
+def _load_json(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 # ============================================================
 # 메인 실행
 # ============================================================
-def main():
+def main(incremental: bool = False):
     start = time.time()
 
-    # 1. 수집
-    df = collect_all_categories()
-
-    # 2~4. 사전 계산 (순차 처리)
-    compute_tfidf(df)
-    compute_stats(df)
-    compute_top_titles(df)
+    # 1. 수집 (수집 실패 카테고리는 직전 스냅샷 유지, 증분 모드: 직전 스냅샷에 video_id 기준으로 반영)
+    last = load_snapshot()
+    previous = last if incremental else None
+    df = collect_all_categories(fallback=last)
+    if previous is not None:
+        df = merge_snapshot(previous, df)
+    save_snapshot(df)
+
+    # 2. 카테고리 콘텐츠 해시 비교 → 바뀐 카테고리만 재계산 (전체 모드는 None = 전부)
+    hashes = category_hashes(df)
+    text_changed = count_changed = None
+    if previous is not None:
+        old = load_manifest()
+        text_changed = {c for c, h in hashes.items() if old.get(c, {}).get("text_hash") != h["text_hash"]}
+        count_changed = text_changed | {c for c, h in hashes.items() if old.get(c, {}).get("count_hash") != h["count_hash"]}
+        logger.info(f"\n증분 갱신: TF-IDF 재학습 {len(text_changed)}개 / 통계 재계산 {len(count_changed)}개 카테고리")
+
+    # 3. TF-IDF 인덱스 / 통계 / 인기 제목 빌드 (카테고리 단위 프로세스 풀)
+    build_artifacts(df, text_only=text_changed, count_only=count_changed)
+    save_manifest(hashes)
 
     elapsed = time.time() - start
     logger.info(f"\n{'='*60}")
@@ -286,4 +755,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="YouTube 데이터 수집 + 사전 계산")
+    parser.add_argument("--incremental", action="store_true", help="직전 스냅샷 대비 바뀐 카테고리만 재계산")
+    main(incremental=parser.parse_args().incremental)
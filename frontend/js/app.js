@@ -7,9 +7,11 @@ const API_BASE = "";  // 같은 서버에서 서빙
 // ================================================================
 let currentJobId = null;
 let pollingTimer  = null;
+let progressSource = null;       // EventSource (SSE 진행 스트림)
 let etaTimer      = null;
+let etaStage      = null;         // 카운트다운 기준 — 대기 순번(숫자) 또는 'processing'
 let selectedFile  = null;
-let jobHistory    = [];          // { jobId, filename, status, pct, result }
+let jobHistory    = [];          // { jobId, filename, status, pct, result, queuePos }
 let currentUser   = { name: 'ooo', email: 'user@example.com' };
 
 // ================================================================
@@ -176,16 +178,19 @@ async function startAnalysis() {
   const idx = jobHistory.length - 1;
 
   // 로딩 뷰로 전환
+  renderLoadingPreview({});
   navigate('loading');
+  etaStage = null;
   startEtaCountdown();
 
   try {
     const res  = await fetch(`${API_BASE}/api/analyze`, { method: 'POST', body: formData });
-    if (!res.ok) throw new Error(`서버 오류: ${res.status}`);
+    if (!res.ok) throw new Error(await uploadErrorMessage(res));
     const data = await res.json();
     currentJobId = data.job_id;
     entry.jobId  = data.job_id;
-    startPolling(idx);
+    if (data.status === 'queued') handleStatus(data, idx);  // 대기 순번은 첫 진행 이벤트 전에 바로 표시
+    startProgress(idx);
   } catch (err) {
     jobHistory.pop();
     clearTimers();
@@ -194,9 +199,42 @@ async function startAnalysis() {
   }
 }
 
+// 업로드 거절 응답을 사용자 안내 문구로 변환 (429 대기열 포화 / 413 용량 초과 / 400 요청 오류)
+async function uploadErrorMessage(res) {
+  const body = await res.json().catch(() => ({}));  // 프록시가 JSON 없이 거절하는 경우 대비
+
+  if (res.status === 429) {
+    const sec  = Number(body.eta_sec || res.headers.get('Retry-After')) || 0;
+    const wait = sec > 60 ? `약 ${Math.ceil(sec/60)}분` : `약 ${Math.max(sec, 1)}초`;
+    return `서버가 다른 영상을 분석 중입니다. ${wait} 후 다시 시도해주세요.`;
+  }
+  if (res.status === 413) {
+    return body.max_upload_mb
+      ? `파일이 너무 큽니다. 영상은 최대 ${body.max_upload_mb}MB까지 업로드할 수 있습니다.`
+      : '파일이 너무 큽니다. 더 작은 영상으로 다시 시도해주세요.';
+  }
+  return body.error || `서버 오류: ${res.status}`;
+}
+
 // ================================================================
-// 폴링
+// 진행 상태 수신 (SSE 우선, 미지원/연결 실패 시 2초 폴링)
 // ================================================================
+function startProgress(histIdx) {
+  clearPolling();
+  if (!window.EventSource) {
+    startPolling(histIdx);
+    return;
+  }
+  progressSource = new EventSource(`${API_BASE}/api/progress/${currentJobId}`);
+  progressSource.addEventListener('progress', e => handleStatus(JSON.parse(e.data), histIdx));
+  progressSource.onerror = () => {
+    // 완료 후 정상 종료가 아닌 연결 오류 → 폴링으로 전환 (EventSource 자동 재연결 대신)
+    if (!progressSource) return;
+    clearPolling();
+    startPolling(histIdx);
+  };
+}
+
 function startPolling(histIdx) {
   clearPolling();
   pollingTimer = setInterval(() => pollStatus(histIdx), 2000);
@@ -205,6 +243,10 @@ function startPolling(histIdx) {
 function clearPolling() {
   clearInterval(pollingTimer);
   pollingTimer = null;
+  if (progressSource) {
+    progressSource.close();
+    progressSource = null;
+  }
 }
 
 function clearTimers() {
@@ -217,42 +259,112 @@ async function pollStatus(histIdx) {
   if (!currentJobId) return;
   try {
     const res  = await fetch(`${API_BASE}/api/status/${currentJobId}`);
-    const data = await res.json();
+    handleStatus(await res.json(), histIdx);
+  } catch (err) {
+    console.error('폴링 오류:', err);
+  }
+}
 
-    if (jobHistory[histIdx]) {
-      jobHistory[histIdx].status = data.status;
-      if (data.status === 'processing') jobHistory[histIdx].pct = 55;
+// Phase 4 산출물 진행 요약 — 예: "제목 ✓ · 썸네일 1/3 · 리포트 …"
+function artifactSummary(data) {
+  const a      = data.artifacts || {};
+  const thumbs = (data.partial?.thumbnails || []).length;
+  return [
+    `제목 ${a.titles === 'done' ? '✓' : '…'}`,
+    `썸네일 ${a.thumbnails === 'done' ? '✓' : `${thumbs}/3`}`,
+    `리포트 ${a.report === 'done' ? '✓' : a.report === 'streaming' ? `${(data.partial?.report_draft || '').length}자 작성 중` : '…'}`,
+  ].join(' · ');
+}
+
+// 로딩 뷰 미리보기 — 완료된 제목·썸네일과 작성 중인 리포트 초안을 바로 보여줌
+function renderLoadingPreview(data) {
+  const partial = data.partial || {};
+  const wrap    = document.getElementById('loadingPreview');
+  if (!wrap) return;
+
+  // 이벤트마다 같은 마크업을 다시 넣으면 이미지가 깜빡이므로 바뀔 때만 교체
+  const setHtml = (el, html) => { if (el.innerHTML !== html) el.innerHTML = html; };
+
+  const titles = partial.titles || [];
+  document.getElementById('lpTitlesWrap').hidden = !titles.length;
+  setHtml(document.getElementById('lpTitles'), titles
+    .map(t => `<li>${escapeHtml(t.title || '')}</li>`).join(''));
+
+  const thumbs    = (partial.thumbnails || []).filter(t => t.url);
+  const thumbsEl  = document.getElementById('lpThumbs');
+  const thumbsKey = thumbs.map(t => t.url).join('|');
+  document.getElementById('lpThumbsWrap').hidden = !thumbs.length;
+  if (thumbsEl.dataset.key !== thumbsKey) {
+    thumbsEl.dataset.key = thumbsKey;
+    thumbsEl.innerHTML   = thumbs
+      .map(t => `<img src="${API_BASE}${t.url}" alt="${escapeHtml(t.style || '')}" />`).join('');
+  }
+
+  const report = partial.report || partial.report_draft || '';
+  document.getElementById('lpReportWrap').hidden     = !report;
+  document.getElementById('lpReportLabel').textContent = partial.report ? 'AI 리포트' : 'AI 리포트 (작성 중…)';
+  const reportEl = document.getElementById('lpReport');
+  reportEl.innerHTML = (typeof marked !== 'undefined') ? marked.parse(report) : escapeHtml(report).replace(/\n/g, '<br>');
+  reportEl.scrollTop = reportEl.scrollHeight;
+
+  wrap.hidden = !(titles.length || thumbs.length || report);
+}
+
+function handleStatus(data, histIdx) {
+  if (jobHistory[histIdx]) {
+    jobHistory[histIdx].status = data.status;
+    if (data.status === 'processing') jobHistory[histIdx].pct = data.partial?.score ? 75 : 55;
+  }
+
+  // 대기 중이면 순번 + 서버 예상 대기시간 기준, 실행이 시작되면 분석 예상 시간 기준으로 카운트다운
+  const queued = data.status === 'queued' && data.queue_position != null;
+  if (queued) {
+    if (jobHistory[histIdx]) jobHistory[histIdx].queuePos = data.queue_position;
+    if (etaStage !== data.queue_position) {
+      etaStage = data.queue_position;
+      startEtaCountdown((data.eta_sec || 0) + ANALYSIS_ETA_SEC);
     }
+  } else if (data.status === 'processing' && etaStage !== 'processing') {
+    if (etaStage !== null) startEtaCountdown();
+    etaStage = 'processing';
+  }
 
-    if (data.status === 'completed') {
-      clearTimers();
-      if (jobHistory[histIdx]) {
-        jobHistory[histIdx].pct    = 100;
-        jobHistory[histIdx].result = data.result;
-        jobHistory[histIdx].status = 'completed';
-      }
-      renderDashboard();
-      navigate('dashboard');
-      // 짧은 딜레이 후 결과 뷰로
-      setTimeout(() => showResults(data.result, jobHistory[histIdx]?.filename || 'video.mp4'), 300);
-
-    } else if (data.status === 'failed') {
-      clearTimers();
-      if (jobHistory[histIdx]) jobHistory[histIdx].status = 'failed';
-      alert(data.error || '분석 중 오류가 발생했습니다.');
-      navigate('upload');
+  const phase = document.getElementById('loadingPhase');
+  if (phase) phase.textContent = queued
+    ? `대기 ${data.queue_position}번째 — 앞선 분석이 끝나면 바로 시작합니다`
+    : data.partial?.score
+    ? `${data.progress} (트렌드 적합도 ${data.partial.score.total}점 · ${artifactSummary(data)})`
+    : (data.progress || '');
+  if (data.status === 'processing') renderLoadingPreview(data);
+
+  if (data.status === 'completed') {
+    clearTimers();
+    if (jobHistory[histIdx]) {
+      jobHistory[histIdx].pct    = 100;
+      jobHistory[histIdx].result = data.result;
+      jobHistory[histIdx].status = 'completed';
     }
-  } catch (err) {
-    console.error('폴링 오류:', err);
+    renderDashboard();
+    navigate('dashboard');
+    // 짧은 딜레이 후 결과 뷰로
+    setTimeout(() => showResults(data.result, jobHistory[histIdx]?.filename || 'video.mp4'), 300);
+
+  } else if (data.status === 'failed') {
+    clearTimers();
+    if (jobHistory[histIdx]) jobHistory[histIdx].status = 'failed';
+    alert(data.error || '분석 중 오류가 발생했습니다.');
+    navigate('upload');
   }
 }
 
 // ================================================================
 // ETA 카운트다운
 // ================================================================
-function startEtaCountdown() {
+const ANALYSIS_ETA_SEC = 120;  // 실행 시작 후 분석 완료까지 예상 시간
+
+function startEtaCountdown(totalSec = ANALYSIS_ETA_SEC) {
   clearInterval(etaTimer);
-  let sec = 120;
+  let sec = totalSec;
   const el = document.getElementById('loadingEta');
   function tick() {
     if (!el) return;
@@ -283,6 +395,7 @@ function renderDashboard() {
     const pct     = job.pct || 0;
     const pctText = job.status === 'completed' ? '100% Complete'
                   : job.status === 'failed'    ? '분석 실패'
+                  : job.status === 'queued' && job.queuePos ? `대기 ${job.queuePos}번째`
                   : `${pct}% Complete`;
     const done    = job.status === 'completed';
     return `
@@ -380,6 +493,7 @@ function renderScore(result) {
   if (meta) meta.innerHTML = [
     `카테고리: ${result.category || '-'}`,
     `발화속도: ${result.wpm || '-'} WPM`,
+    result.speech_metrics?.silence_ratio != null ? `무음 비율: ${Math.round(result.speech_metrics.silence_ratio * 100)}%` : '',
     `프레임: ${result.frame_count || '-'}개`,
     result.analyzed_at ? `분석: ${new Date(result.analyzed_at).toLocaleString('ko-KR')}` : '',
   ].filter(Boolean).map(s => `<span>${s}</span>`).join('');